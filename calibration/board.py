@@ -1,13 +1,123 @@
 import cv2
 import numpy as np
-import matplotlib.pyplot as plt
 
 from cv2 import aruco
 from io import BytesIO
+from functools import lru_cache
 from abc import ABC, abstractmethod
 
 
+@lru_cache(maxsize=16)
+def _get_aruco_dict(dict_id: int) -> aruco.Dictionary:
+    return aruco.getPredefinedDictionary(dict_id)
+
+
+@lru_cache(maxsize=16)
+def _get_charuco_board(squares_x: int,
+                       squares_y: int,
+                       square_length: float,
+                       marker_length: float,
+                       dict_id: int) -> aruco.CharucoBoard:
+    return aruco.CharucoBoard(
+        size=(squares_x, squares_y),
+        squareLength=square_length,
+        markerLength=marker_length,
+        dictionary=_get_aruco_dict(dict_id)
+    )
+
+
+# Растеризация маркеров дорогая: готовое изображение кэшируется по параметрам
+# доски и размеру, массив только для чтения
+@lru_cache(maxsize=4)
+def _render_charuco_board(squares_x: int,
+                          squares_y: int,
+                          square_length: float,
+                          marker_length: float,
+                          dict_id: int,
+                          width_px: int,
+                          height_px: int) -> np.ndarray:
+    board = _get_charuco_board(squares_x, squares_y, square_length, marker_length, dict_id)
+    image = board.generateImage((width_px, height_px))
+    image.flags.writeable = False
+    return image
+
+
+@lru_cache(maxsize=16)
+def _get_grid_board(squares_x: int,
+                    squares_y: int,
+                    marker_length: float,
+                    marker_separation: float,
+                    dict_id: int) -> aruco.GridBoard:
+    return aruco.GridBoard(
+        size=(squares_x, squares_y),
+        markerLength=marker_length,
+        markerSeparation=marker_separation,
+        dictionary=_get_aruco_dict(dict_id)
+    )
+
+
+@lru_cache(maxsize=64)
+def _compute_sizes_px(dpi: int,
+                      squares_x: int,
+                      squares_y: int,
+                      square_length_mm: float,
+                      paper_size_mm: tuple) -> tuple:
+    # Размеры холста и доски в пикселях: (canvas_w, canvas_h, board_w, board_h)
+    px_per_mm = dpi / 25.4
+    paper_w_mm, paper_h_mm = paper_size_mm
+    canvas_w_px = int(paper_w_mm * px_per_mm)
+    canvas_h_px = int(paper_h_mm * px_per_mm)
+
+    board_w_px = int(squares_x * square_length_mm * px_per_mm)
+    board_h_px = int(squares_y * square_length_mm * px_per_mm)
+
+    return canvas_w_px, canvas_h_px, board_w_px, board_h_px
+
+
+def _int_ge(name: str, minimum: int):
+    def validate(board, value):
+        if not isinstance(value, int) or value < minimum:
+            raise ValueError(f"{name} должен быть целым числом ≥ {minimum}")
+        return value
+    return validate
+
+
+def _positive_number(name: str):
+    def validate(board, value):
+        if not isinstance(value, (int, float)) or value <= 0:
+            raise ValueError(f"{name} должен быть положительным числом")
+        return float(value)
+    return validate
+
+
+def _unit_ratio(name: str):
+    def validate(board, value):
+        if not isinstance(value, (int, float)) or not (0 < value <= 1):
+            raise ValueError(f"{name} должен быть числом в диапазоне (0, 1]")
+        return float(value)
+    return validate
+
+
+def _boolean(name: str):
+    def validate(board, value):
+        if not isinstance(value, bool):
+            raise ValueError(f"{name} должен быть булевым значением")
+        return value
+    return validate
+
+
+def _one_of(name: str, choices_attr: str):
+    def validate(board, value):
+        choices = getattr(board, choices_attr)
+        if not isinstance(value, str) or value not in choices:
+            raise ValueError(f"{name} должен быть одним из: {list(choices.keys())}")
+        return value
+    return validate
+
+
 class CalibrationBoard(ABC):
+
+    __slots__ = ("squares_x", "squares_y", "square_length_mm", "dpi", "paper_size")
     
     PAPER_SIZES = {
         "A4": (210, 297),
@@ -16,6 +126,15 @@ class CalibrationBoard(ABC):
         "Letter": (216, 279),
         "Legal": (216, 356)
     }
+
+    # Атрибут -> проверка, выполняется при каждом присваивании (см. __setattr__)
+    _VALIDATORS = {
+        "squares_x": _int_ge("squares_x", 2),
+        "squares_y": _int_ge("squares_y", 2),
+        "square_length_mm": _positive_number("square_length_mm"),
+        "dpi": _int_ge("dpi", 50),
+        "paper_size": _one_of("paper_size", "PAPER_SIZES"),
+    }
     
     def __init__(self,
                  squares_x: int,
@@ -30,64 +149,20 @@ class CalibrationBoard(ABC):
         self.dpi = dpi
         self.paper_size = paper_size
 
-    @property
-    def squares_x(self) -> int:
-        return self._squares_x
-    
-    @property
-    def squares_y(self) -> int:
-        return self._squares_y
-    
-    @property
-    def square_length_mm(self) -> int:
-        return self._square_length_mm
-    
-    @property
-    def dpi(self) -> int:
-        return self._dpi
-    
-    @property
-    def paper_size(self) -> int:
-        return self._paper_size
-    
-    @squares_x.setter
-    def squares_x(self, value: int):
-        if not isinstance(value, int) or value < 2:
-            raise ValueError("squares_x должен быть целым числом ≥ 2")
-        self._squares_x = value
-        
-    @squares_y.setter
-    def squares_y(self, value: int):
-        if not isinstance(value, int) or value < 2:
-            raise ValueError("squares_y должен быть целым числом ≥ 2")
-        self._squares_y = value
-        
-    @square_length_mm.setter
-    def square_length_mm(self, value: float):
-        if not isinstance(value, (int, float)) or value <= 0:
-            raise ValueError("square_length_mm должен быть положительным числом")
-        self._square_length_mm = float(value)
-        
-    @dpi.setter
-    def dpi(self, value: int):
-        if not isinstance(value, int) or value < 50:
-            raise ValueError("dpi должен быть целым числом ≥ 50")
-        self._dpi = value
-        
-    @paper_size.setter
-    def paper_size(self, value: str):
-        if not isinstance(value, str) or value not in self.PAPER_SIZES:
-            raise ValueError(f"paper_size должен быть одним из: {list(self.PAPER_SIZES.keys())}")
-        self._paper_size = value
-        
-    def _compute_canvas_and_scale(self):
-        px_per_mm = self.dpi / 25.4
-        paper_w_mm, paper_h_mm = self.PAPER_SIZES[self.paper_size]
-        canvas_w_px = int(paper_w_mm * px_per_mm)
-        canvas_h_px = int(paper_h_mm * px_per_mm)
+    def __setattr__(self, name, value):
+        validator = self._VALIDATORS.get(name)
+        if validator is not None:
+            value = validator(self, value)
+        object.__setattr__(self, name, value)
 
-        board_w_px = int(self.squares_x * self.square_length_mm * px_per_mm)
-        board_h_px = int(self.squares_y * self.square_length_mm * px_per_mm)
+    def _compute_canvas_and_scale(self):
+        canvas_w_px, canvas_h_px, board_w_px, board_h_px = _compute_sizes_px(
+            self.dpi,
+            self.squares_x,
+            self.squares_y,
+            self.square_length_mm,
+            self.PAPER_SIZES[self.paper_size]
+        )
 
         # scale = canvas_w_px / board_w_px
         # scaled_w = canvas_w_px
@@ -98,15 +173,12 @@ class CalibrationBoard(ABC):
         #     scaled_w = int(board_w_px * scale)
         #     scaled_h = canvas_h_px
 
-        canvas = 255 * np.ones((canvas_h_px, canvas_w_px), dtype=np.uint8)
-        return canvas
+        canvas = np.full((canvas_h_px, canvas_w_px), 255, dtype=np.uint8)
+        return canvas, board_w_px, board_h_px
 
     def generate(self) -> np.ndarray:
-        canvas = self._compute_canvas_and_scale()
-        board_img = self._generate_board_image(
-            int(self.squares_x * self.square_length_mm * (self.dpi / 25.4)),
-            int(self.squares_y * self.square_length_mm * (self.dpi / 25.4))
-        )
+        canvas, board_w_px, board_h_px = self._compute_canvas_and_scale()
+        board_img = self._generate_board_image(board_w_px, board_h_px)
 
         # Получаем размеры изображения доски
         board_h_px, board_w_px = board_img.shape[:2]
@@ -129,6 +201,14 @@ class CalibrationBoard(ABC):
 
 
 class ArucoBasedBoard(CalibrationBoard):
+
+    __slots__ = ("aruco_dict_name",)
+
+    _VALIDATORS = {
+        **CalibrationBoard._VALIDATORS,
+        "aruco_dict_name": _one_of("aruco_dict_name", "ARUCO_DICTS"),
+    }
+
     ARUCO_DICTS = {
         "4x4_50": aruco.DICT_4X4_50,
         "5x5_100": aruco.DICT_5X5_100,
@@ -153,22 +233,20 @@ class ArucoBasedBoard(CalibrationBoard):
         )
         self.aruco_dict_name = aruco_dict_name
 
-    @property
-    def aruco_dict_name(self) -> str:
-        return self._aruco_dict_name
-
-    @aruco_dict_name.setter
-    def aruco_dict_name(self, value: str):
-        if value not in self.ARUCO_DICTS:
-            raise ValueError(f"aruco_dict_name должен быть одним из: {list(self.ARUCO_DICTS.keys())}")
-        self._aruco_dict_name = value
-
     @classmethod
     def get_aruco_dict(cls) -> dict:
         return cls.ARUCO_DICTS
 
    
 class CharucoBoard(ArucoBasedBoard):
+
+    __slots__ = ("marker_length_mm",)
+
+    _VALIDATORS = {
+        **ArucoBasedBoard._VALIDATORS,
+        "marker_length_mm": _positive_number("marker_length_mm"),
+    }
+
     def __init__(self,
                  squares_x: int,
                  squares_y: int,
@@ -187,29 +265,27 @@ class CharucoBoard(ArucoBasedBoard):
         )
         self.marker_length_mm = marker_length_mm
 
-    @property
-    def marker_length_mm(self) -> float:
-        return self._marker_length_mm
-
-    @marker_length_mm.setter
-    def marker_length_mm(self, value: float):
-        if not isinstance(value, (int, float)) or value <= 0:
-            raise ValueError("marker_length_mm должен быть положительным числом")
-        self._marker_length_mm = float(value)
-
     def _generate_board_image(self, width_px: int, height_px: int) -> np.ndarray:
-        aruco_dict_id = self.ARUCO_DICTS[self.aruco_dict_name]
-        aruco_dict = aruco.getPredefinedDictionary(aruco_dict_id)
-        board = cv2.aruco.CharucoBoard(
-            size=(self.squares_x, self.squares_y),
-            squareLength=self.square_length_mm / 1000.0,
-            markerLength=self.marker_length_mm / 1000.0,
-            dictionary=aruco_dict
+        return _render_charuco_board(
+            self.squares_x,
+            self.squares_y,
+            self.square_length_mm / 1000.0,
+            self.marker_length_mm / 1000.0,
+            self.ARUCO_DICTS[self.aruco_dict_name],
+            width_px,
+            height_px
         )
-        return board.generateImage((width_px, height_px))
     
 
 class ArucoBoard(ArucoBasedBoard):
+
+    __slots__ = ("marker_length_ratio",)
+
+    _VALIDATORS = {
+        **ArucoBasedBoard._VALIDATORS,
+        "marker_length_ratio": _unit_ratio("marker_length_ratio"),
+    }
+
     def __init__(self,
                  squares_x: int,
                  squares_y: int,
@@ -228,40 +304,42 @@ class ArucoBoard(ArucoBasedBoard):
         )
         self.marker_length_ratio = marker_length_ratio
 
-    @property
-    def marker_length_ratio(self) -> float:
-        return self._marker_length_ratio
-
-    @marker_length_ratio.setter
-    def marker_length_ratio(self, value: float):
-        if not isinstance(value, (int, float)) or not (0 < value <= 1):
-            raise ValueError("marker_length_ratio должен быть числом в диапазоне (0, 1]")
-        self._marker_length_ratio = float(value)
-
     def _generate_board_image(self, width_px: int, height_px: int) -> np.ndarray:
-        aruco_dict_id = self.ARUCO_DICTS[self.aruco_dict_name]
-        aruco_dict = aruco.getPredefinedDictionary(aruco_dict_id)
-
-        board = aruco.GridBoard(
-            size=(self.squares_x, self.squares_y),
-            markerLength=self.square_length_mm * self.marker_length_ratio / 1000.0,
-            markerSeparation=self.square_length_mm * (1 - self.marker_length_ratio) / 1000.0,
-            dictionary=aruco_dict
+        board = _get_grid_board(
+            self.squares_x,
+            self.squares_y,
+            self.square_length_mm * self.marker_length_ratio / 1000.0,
+            self.square_length_mm * (1 - self.marker_length_ratio) / 1000.0,
+            self.ARUCO_DICTS[self.aruco_dict_name]
         )
 
         return board.generateImage((width_px, height_px))
     
 
 class Checkerboard(CalibrationBoard):
+
+    __slots__ = ()
+
     def _generate_board_image(self, width_px: int, height_px: int) -> np.ndarray:
-        base = ((np.indices((self.squares_y, self.squares_x)).sum(axis=0) % 2) * 255).astype(np.uint8)
-        board_img = cv2.resize(base, (width_px, height_px), interpolation=cv2.INTER_NEAREST)
-        
+        base = ((np.add.outer(np.arange(self.squares_y), np.arange(self.squares_x)) & 1) * 255).astype(np.uint8)
+
+        col_edges = (np.arange(self.squares_x + 1) * width_px) // self.squares_x
+        row_edges = (np.arange(self.squares_y + 1) * height_px) // self.squares_y
+        board_img = np.repeat(np.repeat(base, np.diff(row_edges), axis=0), np.diff(col_edges), axis=1)
+
         return board_img
 
     
 
 class CircleBoard(CalibrationBoard):
+
+    __slots__ = ("asymmetric",)
+
+    _VALIDATORS = {
+        **CalibrationBoard._VALIDATORS,
+        "asymmetric": _boolean("asymmetric"),
+    }
+
     def __init__(self,
                  squares_x: int,
                  squares_y: int,
@@ -272,18 +350,8 @@ class CircleBoard(CalibrationBoard):
         super().__init__(squares_x, squares_y, square_length_mm, dpi, paper_size)
         self.asymmetric = asymmetric
 
-    @property
-    def asymmetric(self) -> bool:
-        return self._asymmetric
-
-    @asymmetric.setter
-    def asymmetric(self, value: bool):
-        if not isinstance(value, bool):
-            raise ValueError("asymmetric должен быть булевым значением")
-        self._asymmetric = value
-
     def _generate_board_image(self, width_px: int, height_px: int) -> np.ndarray:
-        board_img = 255 * np.ones((height_px, width_px), dtype=np.uint8)
+        board_img = np.full((height_px, width_px), 255, dtype=np.uint8)
         
         radius = int(0.25 * min(width_px / self.squares_x, height_px / self.squares_y))
         
@@ -325,18 +393,18 @@ class PDFExporter:
             raise ValueError(f"Неверный формат бумаги: {paper_size}")
 
         paper_w_mm, paper_h_mm = paper_sizes[paper_size]
-        fig_w_inch = paper_w_mm / 25.4
-        fig_h_inch = paper_h_mm / 25.4
+        page_w_px = int(paper_w_mm / 25.4 * dpi)
+        page_h_px = int(paper_h_mm / 25.4 * dpi)
 
-        fig = plt.figure(figsize=(fig_w_inch, fig_h_inch), dpi=dpi)
-        ax = fig.add_axes([0, 0, 1, 1]) 
-        ax.axis('off')
+        # Холст растягивается на весь лист при заданном dpi
+        if canvas.shape[:2] != (page_h_px, page_w_px):
+            canvas = cv2.resize(canvas, (page_w_px, page_h_px), interpolation=cv2.INTER_AREA)
 
-        ax.imshow(canvas, cmap='gray', )
+        # PIL нужен только для экспорта в PDF
+        from PIL import Image
 
         buf = BytesIO()
-        plt.savefig(buf, format='pdf', dpi=dpi, bbox_inches=None, pad_inches=0)
-        plt.close(fig)
+        Image.fromarray(canvas).save(buf, format="PDF", resolution=float(dpi))
         buf.seek(0)
 
         return buf
@@ -1,8 +1,26 @@
 import numpy as np
 from cv2 import aruco
+from functools import lru_cache
 from typing import Tuple, Union
 
 from calibration import MarkersBoard
+from calibration.board.marker_board import _get_aruco_dict
+
+
+@lru_cache(maxsize=16)
+def _get_grid_board(
+    grid_cells: Tuple[int, int],
+    marker_length: float,
+    marker_separation: float,
+    dict_id: int
+) -> aruco.GridBoard:
+    """Return a shared ArUco grid board, built once per board configuration."""
+    return aruco.GridBoard(
+        size=grid_cells,
+        markerLength=marker_length,
+        markerSeparation=marker_separation,
+        dictionary=_get_aruco_dict(dict_id)
+    )
 
 class ArucoBoard(MarkersBoard):
     """Class for generating ArUco marker calibration boards."""
@@ -53,11 +71,11 @@ class ArucoBoard(MarkersBoard):
         Returns:
             numpy.ndarray: Generated board image
         """
-        board = aruco.GridBoard(
-            size=self._grid_cells,
-            markerLength=self._cell_size_mm * self._marker_length_ratio / 1000,
-            markerSeparation=self._cell_size_mm * (1 - self._marker_length_ratio) / 1000,
-            dictionary=self._aruco_dict
+        board = _get_grid_board(
+            self._grid_cells,
+            self._cell_size_mm * self._marker_length_ratio / 1000,
+            self._cell_size_mm * (1 - self._marker_length_ratio) / 1000,
+            self.ARUCO_DICTS[self._aruco_dict_name]
         )
         
         return board.generateImage((width, height))
\ No newline at end of file
@@ -1,9 +1,7 @@
 import io
 import cv2
 import numpy as np
-from reportlab.pdfgen import canvas
 from typing import Tuple, Union, Optional, Dict
-from reportlab.lib.utils import ImageReader
 
 
 class BoardCalibrator:
@@ -162,7 +160,7 @@ class BoardCalibrator:
         board_w_px = int(grid_w * self._cell_size_mm * self.__px2mm)
         board_h_px = int(grid_h * self._cell_size_mm * self.__px2mm)
 
-        canvas = 255 * np.ones((canvas_h_px, canvas_w_px), dtype=np.uint8)
+        canvas = np.full((canvas_h_px, canvas_w_px), 255, dtype=np.uint8)
 
         return canvas, board_w_px, board_h_px
     
@@ -174,6 +172,10 @@ class BoardCalibrator:
             image: Board image to save
             filename: Output PDF filename
         """
+        # reportlab is only needed for PDF output, keep it off the import path
+        from reportlab.pdfgen import canvas
+        from reportlab.lib.utils import ImageReader
+
         paper_w_pt, paper_h_pt = (mm * self.__mm2pt for mm in self._paper_size_mm)
 
         is_success, buffer = cv2.imencode(".png", image)
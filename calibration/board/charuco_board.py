@@ -1,8 +1,40 @@
 import numpy as np
 from cv2 import aruco
+from functools import lru_cache
 from typing import Tuple, Union
 
 from calibration import MarkersBoard
+from calibration.board.marker_board import _get_aruco_dict
+
+
+@lru_cache(maxsize=16)
+def _get_charuco_board(
+    grid_cells: Tuple[int, int],
+    square_length: float,
+    marker_length: float,
+    dict_id: int
+) -> aruco.CharucoBoard:
+    """Return a shared ChArUco board, built once per board configuration."""
+    return aruco.CharucoBoard(
+        size=grid_cells,
+        squareLength=square_length,
+        markerLength=marker_length,
+        dictionary=_get_aruco_dict(dict_id)
+    )
+
+
+@lru_cache(maxsize=4)
+def _render_charuco_board(
+    grid_cells: Tuple[int, int],
+    square_length: float,
+    marker_length: float,
+    dict_id: int,
+    size: Tuple[int, int]
+) -> np.ndarray:
+    """Return a read-only rendering of a ChArUco board, rasterized once per configuration and size."""
+    image = _get_charuco_board(grid_cells, square_length, marker_length, dict_id).generateImage(size)
+    image.flags.writeable = False
+    return image
 
 
 class CharucoBoard(MarkersBoard):
@@ -54,11 +86,10 @@ class CharucoBoard(MarkersBoard):
         Returns:
             numpy.ndarray: Generated board image
         """
-        board = aruco.CharucoBoard(
-            size=self._grid_cells,
-            squareLength=self._cell_size_mm/1000,
-            markerLength=self._marker_length_mm/1000,
-            dictionary=self._aruco_dict
-        )
-
-        return board.generateImage((width, height))
\ No newline at end of file
+        return _render_charuco_board(
+            self._grid_cells,
+            self._cell_size_mm / 1000,
+            self._marker_length_mm / 1000,
+            self.ARUCO_DICTS[self._aruco_dict_name],
+            (width, height)
+        )
\ No newline at end of file
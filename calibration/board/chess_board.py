@@ -1,4 +1,3 @@
-import cv2
 import numpy as np
 
 from calibration import BoardCalibrator
@@ -19,7 +18,11 @@ class ChessBoard(BoardCalibrator):
             numpy.ndarray: Generated board image
         """
         grid_x, grid_y = self._grid_cells
-        base = ((np.indices((grid_y, grid_x)).sum(axis=0) % 2) * 255).astype(np.uint8)
-        board_img = cv2.resize(base, (width, height), interpolation=cv2.INTER_NEAREST)
+        base = ((np.add.outer(np.arange(grid_y), np.arange(grid_x)) & 1) * 255).astype(np.uint8)
+
+        # Exact cell edges, so every square keeps its metric size to within one pixel
+        col_edges = (np.arange(grid_x + 1) * width) // grid_x
+        row_edges = (np.arange(grid_y + 1) * height) // grid_y
+        board_img = np.repeat(np.repeat(base, np.diff(row_edges), axis=0), np.diff(col_edges), axis=1)
 
         return board_img
\ No newline at end of file
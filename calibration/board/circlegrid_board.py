@@ -52,21 +52,19 @@ class CircleGridBoard(BoardCalibrator):
         Returns:
             numpy.ndarray: Generated board image
         """
-        board_img = 255 * np.ones((height, width), dtype=np.uint8)
+        board_img = np.full((height, width), 255, dtype=np.uint8)
         
         grid_x, grid_y = self._grid_cells
         radius = int(0.25 * min(width / grid_x, height / grid_y))
 
-        for y in range(grid_y):
-            for x in range(grid_x):
-                cx = int((x + 0.5) * width / grid_x)
-                cy = int((y + 0.5) * height / grid_y)
+        columns = np.arange(grid_x)
+        rows = np.arange(grid_y)[:, None]
+        centers_x = ((columns + 0.5 + 0.5 * self._asymmetric * (rows % 2)) * width / grid_x).astype(np.int32)
+        centers_y = np.broadcast_to(((rows + 0.5) * height / grid_y).astype(np.int32), centers_x.shape)
+        inside = (centers_x < width) & (centers_y < height)
 
-                if self._asymmetric:
-                    cx = int((x + 0.5 + 0.5 * (y % 2)) * width / grid_x)
-
-                if 0 <= cx < width and 0 <= cy < height:
-                    cv2.circle(board_img, (cx, cy), radius, 0, -1)
+        for cx, cy in zip(centers_x[inside].tolist(), centers_y[inside].tolist()):
+            cv2.circle(board_img, (cx, cy), radius, 0, -1)
 
         return board_img
     
\ No newline at end of file
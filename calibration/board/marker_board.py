@@ -1,8 +1,16 @@
 from cv2 import aruco
+from functools import lru_cache
 from typing import Tuple, Union, Dict
 
 from calibration import BoardCalibrator
 
+
+@lru_cache(maxsize=16)
+def _get_aruco_dict(dict_id: int) -> aruco.Dictionary:
+    """Return a shared predefined ArUco dictionary, built once per dictionary id."""
+    return aruco.getPredefinedDictionary(dict_id)
+
+
 class MarkersBoard(BoardCalibrator):
     """
     Base class for marker-based calibration boards (Aruco/Charuco).
@@ -50,7 +58,7 @@ class MarkersBoard(BoardCalibrator):
         if value not in self.ARUCO_DICTS:
             raise ValueError(f"aruco_dict_name must be one of: {list(self.ARUCO_DICTS.keys())}")
         self._aruco_dict_name = value
-        self._aruco_dict = aruco.getPredefinedDictionary(self.ARUCO_DICTS[self._aruco_dict_name])
+        self._aruco_dict = _get_aruco_dict(self.ARUCO_DICTS[self._aruco_dict_name])
 
     @classmethod
     def get_aruco_dict(cls) -> Dict[str, int]:
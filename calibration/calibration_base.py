@@ -1,26 +1,69 @@
+import os
 import cv2
+import re
 import json
+import fnmatch
 import numpy as np
 
+from PIL import Image
 from pathlib import Path
-from typing import Tuple, Union, List, Any
-from calibration.types import ImageSize, ImagePath, Optional, Dict
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from typing import Tuple, Union, List, Any, Callable
+from calibration.types import ImageSize, ImagePath, FileSignature, Optional, Dict
+
+try:
+    import orjson
+except ImportError:  # optional, only speeds up the .json export
+    orjson = None
+
+
+EXIF_ORIENTATION_TAG = 0x0112
+
+# Exact-type dispatch for the JSON fallback; containers map to None and are walked
+_JSON_CONVERTERS = {
+    np.ndarray: np.ndarray.tolist,
+    np.generic: np.generic.item,
+    dict: None,
+    list: None,
+    tuple: None,
+}
+
+
+@lru_cache(maxsize=32)
+def _compile_pattern(pattern: str) -> re.Pattern:
+    """Compiles a glob pattern into a regex matching file names."""
+    return re.compile(fnmatch.translate(pattern))
 
 
 class CameraBaseCalibrator:
+    # DANIILIDIS (dual quaternions, closed form) is the default
+    HANDEYE_METHODS = {
+        "DANIILIDIS": "CALIB_HAND_EYE_DANIILIDIS",
+        "PARK": "CALIB_HAND_EYE_PARK",
+        "TSAI": "CALIB_HAND_EYE_TSAI",
+        "ANDREFF": "CALIB_HAND_EYE_ANDREFF",
+        "HORAUD": "CALIB_HAND_EYE_HORAUD"
+    }
+
     def __init__(self,
                 image_folder: Union[str, Path],
-                pattern_size: Tuple[int, int]) -> None:
+                pattern_size: Tuple[int, int],
+                use_lu: bool = True) -> None:
         """
         Base abstract class for camera calibration.
 
         :param image_folder: Path to folder containing calibration images
         :param pattern_size: Pattern size as (columns, rows) of inner corners
+        :param use_lu: Use LU instead of SVD decomposition in the calibration solver
+                       (faster; disable for ill-conditioned datasets)
         """
 
         self.image_folder = image_folder
         self.pattern_size = pattern_size
+        self.use_lu = use_lu
         self._images_size: ImageSize = ()
+        self._detection_cache: Dict[FileSignature, Any] = {}
         self._calibration_result: Optional[Dict[str, Any]] = None
 
     @property
@@ -57,6 +100,120 @@ class CameraBaseCalibrator:
 
         self._pattern_size = value
 
+        # Planar (N, 3) grid of pattern points with unit spacing, scaled by subclasses
+        width, height = value
+        self._objp_template = np.zeros((height * width, 3), dtype=np.float32)
+        self._objp_template[:, :2] = np.mgrid[0:width, 0:height].T.reshape(-1, 2)
+        self._invalidate_detections()
+
+    @property
+    def use_lu(self) -> bool:
+        return self._use_lu
+
+    @use_lu.setter
+    def use_lu(self, value: bool) -> None:
+        if not isinstance(value, bool):
+            raise TypeError("use_lu must be a boolean")
+
+        self._use_lu = value
+
+    @property
+    def calibration_result(self) -> Optional[Dict[str, Any]]:
+        return self._calibration_result
+
+    @calibration_result.setter
+    def calibration_result(self, value: Dict[str, Any]) -> None:
+        if not isinstance(value, dict):
+            raise TypeError("calibration_result must be a dictionary")
+
+        self.__validate_calibration_data(value)
+        self._calibration_result = value
+
+    def _invalidate_detections(self) -> None:
+        """
+        Drops the cached detections. Setters that change what find_corners returns call this.
+        """
+        self._detection_cache = {}
+
+    def _detect(self, img_path: ImagePath) -> Optional[Any]:
+        """
+        Runs the subclass find_corners on an image, memoized by file identity (device, inode),
+        mtime and size, so hand-eye calibration reuses what calibrate already found even when
+        image_folder was reassigned with a different spelling of the same directory.
+
+        :param img_path: Path to the image file
+        :return: Result of find_corners or None if the file can not be read
+        """
+        key = self._file_signature(img_path)
+        if key is None:
+            return None
+
+        detection = self._detection_cache.get(key)
+        if detection is None:
+            gray = self._load_gray(img_path)
+            if gray is None:
+                return None
+
+            detection = self.find_corners(gray)
+            self._detection_cache[key] = detection
+
+        return detection
+
+    def _calibration_flags(self) -> int:
+        """
+        Builds the flags passed to the OpenCV calibration routines.
+
+        :return: Bitmask of cv2.CALIB_* flags
+        """
+        return cv2.CALIB_USE_LU if self._use_lu else 0
+
+    @staticmethod
+    def _read_image_size(img_path: ImagePath) -> Optional[ImageSize]:
+        """
+        Reads the image resolution from the file header without decoding the pixels.
+
+        :param img_path: Path to the image file
+        :return: Image size as (width, height) or None if the file can not be read
+        """
+        try:
+            with Image.open(img_path) as image:
+                width, height = image.size
+                orientation = image.getexif().get(EXIF_ORIENTATION_TAG, 1)
+        except OSError:
+            return None
+
+        # cv2.imread applies EXIF orientation, which swaps the axes for these values
+        if orientation in (5, 6, 7, 8):
+            width, height = height, width
+
+        return width, height
+
+    def _list_images(self, pattern: str = "*") -> List[ImagePath]:
+        """
+        Lists the files in the image folder matching the pattern, sorted by name.
+        Flat patterns are matched during a single os.scandir pass (file types come from
+        the directory listing, no stat per entry); recursive patterns go through Path.glob.
+
+        :param pattern: Glob pattern to match image files
+        :return: Sorted list of matching file paths
+        """
+        if "/" in pattern or os.sep in pattern or "**" in pattern:
+            matches = sorted(self._image_folder.glob(pattern))
+            entries = [(path, path.is_file()) for path in matches]
+        else:
+            match = _compile_pattern(pattern).match
+            with os.scandir(self._image_folder) as it:
+                entries = sorted((Path(entry.path), entry.is_file()) for entry in it if match(entry.name))
+
+        image_paths: List[ImagePath] = []
+        for img_path, is_file in entries:
+            if not is_file:
+                print(f"Skipped non-file path: {img_path}")
+                continue
+            image_paths.append(img_path)
+
+        return image_paths
+
     def _check_images_size(self,
                             pattern: str = "*") -> Tuple[ImageSize, List[ImagePath]]:
         """
@@ -68,40 +225,82 @@ class CameraBaseCalibrator:
         if not isinstance(pattern, str):
             raise TypeError("pattern must be a string")
 
-        image_sizes: List[ImageSize] = []
-        image_paths: List[ImagePath] = list(self._image_folder.glob(pattern))
+        image_paths = self._list_images(pattern)
 
         if not image_paths:
             raise ValueError("No images found with the given pattern")
 
-        for img_path in image_paths:
-            if not img_path.is_file():
-                print(f"Skipped non-file path: {img_path}")
-                continue
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            read_sizes = list(executor.map(self._read_image_size, image_paths))
 
-            image = cv2.imread(str(img_path))
-            if image is None:
+        image_sizes: List[ImageSize] = []
+        for img_path, size in zip(image_paths, read_sizes):
+            if size is None:
                 print(f"Failed to load image: {img_path.name}")
                 continue
-
-            height, width = image.shape[:2]
-            image_sizes.append((width, height))
+            image_sizes.append(size)
 
         if not image_sizes:
             raise ValueError("No valid images found for calibration")
 
-        ref_size = image_sizes[0]
-        for idx, size in enumerate(image_sizes):
-            if size != ref_size:
-                raise ValueError(
-                    f"Image at index {idx} has different resolution: {size} vs {ref_size}"
-                )
+        sizes = np.asarray(image_sizes, dtype=np.int32)
+        mismatch = np.flatnonzero((sizes != sizes[0]).any(axis=1))
+        if mismatch.size:
+            idx = int(mismatch[0])
+            raise ValueError(
+                f"Image at index {idx} has different resolution: {image_sizes[idx]} vs {image_sizes[0]}"
+            )
+
+        self._images_size = image_sizes[0]
+        return self._images_size, image_paths
+
+    @staticmethod
+    def _file_signature(img_path: ImagePath) -> Optional[FileSignature]:
+        """
+        Identifies the current contents of a file by device, inode, mtime and size.
+
+        :param img_path: Path to the image file
+        :return: Signature tuple or None if the file can not be stat'ed
+        """
+        try:
+            stat = os.stat(img_path)
+        except OSError:
+            return None
+        return stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+    def _load_gray(self, img_path: ImagePath) -> Optional[np.ndarray]:
+        """
+        Decodes an image as a single-channel grayscale frame.
+
+        :param img_path: Path to the image file
+        :return: Grayscale image or None if the file can not be read
+        """
+        # JPEG luma is decoded straight to one channel, without the BGR round trip
+        return cv2.imread(str(img_path), cv2.IMREAD_GRAYSCALE)
 
-        return ref_size, image_paths
+    def _map_images(self,
+                    fn: Callable[[ImagePath], Any],
+                    image_paths: List[ImagePath],
+                    workers: Optional[int] = None) -> List[Any]:
+        """
+        Applies a per-image callable to all image paths on a thread pool.
+        OpenCV releases the GIL while decoding and detecting, so images are processed in parallel.
+
+        :param fn: Callable processing a single image path
+        :param image_paths: Image paths to process
+        :param workers: Number of worker threads (defaults to the CPU count)
+        :return: Results of fn in the same order as image_paths
+        """
+        if workers is not None and (not isinstance(workers, int) or workers < 1):
+            raise ValueError("workers must be a positive integer")
+
+        with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+            return list(executor.map(fn, image_paths))
 
     # TODO: Починить загрузку и сохранение в файл
     def save_calibration_result(self,
-                                output_path: Union[str, Path]) -> None:
+                                output_path: Union[str, Path],
+                                compress: bool = False) -> None:
         """
         Save calibration results to file. Format is determined automatically by file extension.
 
@@ -111,8 +310,12 @@ class CameraBaseCalibrator:
             - .txt: Simple text format with matrices
 
         :param output_path: Path to save the result
+        :param compress: Compress the arrays when saving to .npz
         """
 
+        if not isinstance(compress, bool):
+            raise TypeError("compress must be a boolean")
+
         if self._calibration_result is None:
             raise RuntimeError("No calibration data available. Run 'calibrate()' first.")
 
@@ -122,7 +325,7 @@ class CameraBaseCalibrator:
         ext = output_path.suffix.lower()
 
         if ext == ".npz":
-            self.__save_npz(output_path)
+            self.__save_npz(output_path, compress)
         elif ext == ".json":
             self.__save_json(output_path)
         elif ext == ".txt":
@@ -130,24 +333,50 @@ class CameraBaseCalibrator:
         else:
             raise ValueError(f"Unsupported file extension: {ext}. Use .npz, .json or .txt")
 
-    def __save_npz(self, path: Path) -> None:
-        """Save result as compressed .npz file"""
-        np.savez_compressed(path, **self._calibration_result)
+    def __save_npz(self, path: Path, compress: bool = False) -> None:
+        """Save result as .npz file (uncompressed unless requested)"""
+        if compress:
+            np.savez_compressed(path, **self._calibration_result)
+        else:
+            np.savez(path, **self._calibration_result)
 
     def __save_json(self, path: Path) -> None:
         """Save result as JSON file (supports basic types and numpy arrays/dtypes only)"""
         
-        def serialize(obj):
-            if isinstance(obj, np.ndarray):
-                return obj.tolist()
-            elif isinstance(obj, np.generic):
-                return obj.item()
-            elif isinstance(obj, dict):
-                return {key: serialize(value) for key, value in obj.items()}
-            elif isinstance(obj, (list, tuple)):
-                return [serialize(value) for value in obj]
-            else:
-                return obj
+        def serialize(root):
+            # Iterative walk: each stack entry is (parent container, key, value to convert)
+            result = [None]
+            stack = [(result, 0, root)]
+            while stack:
+                parent, key, obj = stack.pop()
+                kind = type(obj)
+                if kind not in _JSON_CONVERTERS:
+                    kind = next((base for base in _JSON_CONVERTERS if isinstance(obj, base)), None)
+
+                if kind is None:
+                    parent[key] = obj
+                elif kind is dict:
+                    out = dict.fromkeys(obj)
+                    stack.extend((out, k, v) for k, v in obj.items())
+                    parent[key] = out
+                elif kind is list or kind is tuple:
+                    out = [None] * len(obj)
+                    stack.extend(zip([out] * len(obj), range(len(obj)), obj))
+                    parent[key] = out
+                else:
+                    parent[key] = _JSON_CONVERTERS[kind](obj)
+            return result[0]
+
+        if orjson is not None:
+            try:
+                path.write_bytes(orjson.dumps(
+                    self._calibration_result,
+                    option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2
+                ))
+                return
+            except orjson.JSONEncodeError:
+                # Unsupported dtypes or non-contiguous arrays go through the generic path
+                pass
 
         serializable_data = serialize(self._calibration_result)
 
@@ -332,52 +561,124 @@ class CameraBaseCalibrator:
         
         return R_z @ R_y @ R_x
 
+    @staticmethod
+    def _euler_to_rotation_matrices(angles: np.ndarray) -> np.ndarray:
+        """
+        Vectorized version of _euler_to_rotation_matrix for a batch of poses.
+
+        Args:
+            angles: (N, 3) array of (roll, pitch, yaw) in radians
+
+        Returns:
+            (N, 3, 3) array of rotation matrices R_z @ R_y @ R_x
+        """
+        angles = np.asarray(angles, dtype=np.float64)
+        cr, cp, cy = np.cos(angles).T
+        sr, sp, sy = np.sin(angles).T
+
+        R = np.empty((len(angles), 3, 3), dtype=np.float64)
+        R[:, 0, 0] = cy * cp
+        R[:, 0, 1] = cy * sp * sr - sy * cr
+        R[:, 0, 2] = cy * sp * cr + sy * sr
+        R[:, 1, 0] = sy * cp
+        R[:, 1, 1] = sy * sp * sr + cy * cr
+        R[:, 1, 2] = sy * sp * cr - cy * sr
+        R[:, 2, 0] = -sp
+        R[:, 2, 1] = cp * sr
+        R[:, 2, 2] = cp * cr
+        return R
+
+    @classmethod
+    def _handeye_method(cls, calib_method: str) -> int:
+        """
+        Resolves a hand-eye method name to the OpenCV enum.
+
+        :param calib_method: Method name (case-insensitive), one of HANDEYE_METHODS
+        :return: cv2.CALIB_HAND_EYE_* value
+        """
+        if not isinstance(calib_method, str):
+            raise TypeError("calib_method must be a string")
+
+        method_upper = calib_method.upper()
+        if method_upper not in cls.HANDEYE_METHODS:
+            raise ValueError(f"Unknown hand-eye calibration method '{calib_method}'. "
+                            f"Available: {list(cls.HANDEYE_METHODS.keys())}")
+
+        cv2_enum_name = cls.HANDEYE_METHODS[method_upper]
+
+        if not hasattr(cv2, cv2_enum_name):
+            available = [k for k, v in cls.HANDEYE_METHODS.items() if hasattr(cv2, v)]
+            raise RuntimeError(
+                f"Your OpenCV version does not support method '{calib_method}' "
+                f"(cv2.{cv2_enum_name} not found).\n"
+                f"Available in your build: {available}"
+            )
+
+        return getattr(cv2, cv2_enum_name)
+
     @staticmethod
     def _handeye_calibration_decorator(method):
 
         def wrapper(self, 
-                    gripper_poses: List[Tuple], 
+                    gripper_poses: Union[List[Tuple], np.ndarray], 
                     pattern: str="*",
-                    calib_method: str="DANIILIDIS"):
-            
-            if self._calibration_result is None:
-                raise ValueError("Camera calibration must be performed first")
+                    calib_method: str="DANIILIDIS",
+                    camera_matrix: Optional[np.ndarray] = None,
+                    dist_coeffs: Optional[np.ndarray] = None):
+
+            # Resolved before any image is processed, so a typo fails fast
+            method_enum = self._handeye_method(calib_method)
+
+            # Explicit intrinsics take precedence over the stored calibration result
+            if camera_matrix is None or dist_coeffs is None:
+                if self._calibration_result is None:
+                    raise ValueError("Camera calibration must be performed first")
+
+                if camera_matrix is None:
+                    camera_matrix = self._calibration_result["matrix"]
+                if dist_coeffs is None:
+                    dist_coeffs = self._calibration_result["distortion"]
             
-            if not isinstance(gripper_poses, list):
-                raise TypeError("gripper_poses must be a list")
+            if not isinstance(gripper_poses, (list, np.ndarray)):
+                raise TypeError("gripper_poses must be a list or a numpy array")
+
+            poses = np.asarray(gripper_poses, dtype=np.float64)
+            if poses.ndim != 2 or poses.shape[1] != 6:
+                raise ValueError("gripper_poses must contain (x, y, z, roll, pitch, yaw) poses")
                 
             if not isinstance(pattern, str):
                 raise TypeError("pattern must be a string")
 
             _, images = self._check_images_size(pattern=pattern)
             
-            if len(images) != len(gripper_poses):
+            if len(images) != len(poses):
                 raise ValueError("Number of images must match number of gripper poses")
             
-            if self._calibration_result["matrix"].shape != (3, 3):
+            if not isinstance(camera_matrix, np.ndarray) or camera_matrix.shape != (3, 3):
                 raise ValueError("Invalid camera matrix in calibration result")
 
+            if not isinstance(dist_coeffs, np.ndarray):
+                raise ValueError("dist_coeffs must be a numpy array")
+
             R_gripper2base = []
             t_gripper2base = []
             R_target2cam = []
             t_target2cam = []
             
-            for img, pose in zip(images, gripper_poses):
-                if isinstance(img, (str, Path)):
-                    img = cv2.imread(str(img))
-                    if img is None:
-                        print(f"Failed to load image: {img}")
-                        continue
-
-                gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-                target_pose = method(self, gray)
+            R_gripper_all = self._euler_to_rotation_matrices(poses[:, 3:])
+            t_gripper_all = poses[:, :3, np.newaxis]
+
+            for img, R_gripper, t_gripper in zip(images, R_gripper_all, t_gripper_all):
+                detection = self._detect(img)
+                if detection is None:
+                    print(f"Failed to load image: {img}")
+                    continue
+
+                target_pose = method(self, detection, camera_matrix, dist_coeffs)
                 if target_pose is None:
                     continue
 
                 R_target, t_target = target_pose
-                x, y, z, roll, pitch, yaw = pose
-                t_gripper = np.array([x, y, z]).reshape(3, 1)
-                R_gripper = self._euler_to_rotation_matrix(roll, pitch, yaw)
 
                 R_target2cam.append(R_target)
                 t_target2cam.append(t_target)
@@ -387,31 +688,6 @@ class CameraBaseCalibrator:
             if len(R_gripper2base) < 5:
                 raise ValueError(f"Insufficient valid samples: {len(R_gripper2base)}/5")
             
-            method_map = {
-                "DANIILIDIS": "CALIB_HAND_EYE_DANIILIDIS",
-                "PARK": "CALIB_HAND_EYE_PARK",
-                "TSAI": "CALIB_HAND_EYE_TSAI",
-                "ANDREFF": "CALIB_HAND_EYE_ANDREFF",
-                "HORAUD": "CALIB_HAND_EYE_HORAUD"
-            }
-
-            method_upper = calib_method.upper()
-            if method_upper not in method_map:
-                raise ValueError(f"Unknown hand-eye calibration method '{method}'. "
-                                f"Available: {list(method_map.keys())}")
-
-            cv2_enum_name = method_map[method_upper]
-
-            if not hasattr(cv2, cv2_enum_name):
-                available = [k for k, v in method_map.items() if hasattr(cv2, v)]
-                raise RuntimeError(
-                    f"Your OpenCV version does not support method '{method}' "
-                    f"(cv2.{cv2_enum_name} not found).\n"
-                    f"Available in your build: {available}"
-                )
-
-            method_enum = getattr(cv2, cv2_enum_name)
-
             return cv2.calibrateHandEye(
                 R_gripper2base=R_gripper2base,
                 t_gripper2base=t_gripper2base,
@@ -19,7 +19,9 @@ class ArucoBoardCalibrator(ArucoMarkerCalibrator):
         pattern_size: Tuple[int, int],
         aruco_dict_name: str = "5x5_250",
         marker_length_mm: Union[float, int] = 25.0,
-        marker_separation: float = 0.25
+        marker_separation: float = 0.25,
+        use_lu: bool = True,
+        detector_params: Optional[aruco.DetectorParameters] = None
     ):
         """
         :param image_folder: Path to folder with images
@@ -27,6 +29,8 @@ class ArucoBoardCalibrator(ArucoMarkerCalibrator):
         :param aruco_dict_name: Dictionary name for ArUco markers
         :param marker_length_mm: Marker side length in millimeters
         :param marker_separation: Separation between markers (relative to marker size)
+        :param use_lu: Use LU instead of SVD decomposition in the calibration solver
+        :param detector_params: ArUco detector parameters (OpenCV defaults with sub-pixel corner refinement if None)
         """
         if not isinstance(marker_separation, float):
             raise TypeError("marker_separation must be a float")
@@ -35,7 +39,9 @@ class ArucoBoardCalibrator(ArucoMarkerCalibrator):
             image_folder=image_folder,
             pattern_size=pattern_size,
             aruco_dict_name=aruco_dict_name,
-            marker_length_mm=marker_length_mm
+            marker_length_mm=marker_length_mm,
+            use_lu=use_lu,
+            detector_params=detector_params
         )
 
         self.marker_separation = marker_separation  # invokes setter
@@ -82,7 +88,8 @@ class ArucoBoardCalibrator(ArucoMarkerCalibrator):
         self,
         pattern: str = "*",
         camera_matrix: Optional[np.ndarray] = None,
-        dist_coeffs: Optional[np.ndarray] = None
+        dist_coeffs: Optional[np.ndarray] = None,
+        n_threads: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         Calibrates the camera using detected ArUco markers.
@@ -90,6 +97,7 @@ class ArucoBoardCalibrator(ArucoMarkerCalibrator):
         :param pattern: Glob pattern to find images
         :param camera_matrix: Initial camera matrix (optional)
         :param dist_coeffs: Initial distortion coefficients (optional)
+        :param n_threads: Number of detection threads (defaults to the CPU count)
         :return: Calibration results dictionary
         """
         if not isinstance(pattern, str):
@@ -102,7 +110,8 @@ class ArucoBoardCalibrator(ArucoMarkerCalibrator):
         all_corners, all_ids, counter, img_size = self._preprocess_images(
             error_msg="Insufficient valid images with ArUco markers for calibration",
             pattern=pattern,
-            extend_corners=True
+            extend_corners=True,
+            n_threads=n_threads
         )
 
         all_ids = np.vstack(all_ids).astype(np.int32)
@@ -115,7 +124,8 @@ class ArucoBoardCalibrator(ArucoMarkerCalibrator):
             board=self._board,
             imageSize=img_size,
             cameraMatrix=camera_matrix,
-            distCoeffs=dist_coeffs
+            distCoeffs=dist_coeffs,
+            flags=self._calibration_flags()
         )
 
         self._calibration_result = {
@@ -129,17 +139,20 @@ class ArucoBoardCalibrator(ArucoMarkerCalibrator):
         return self._calibration_result
 
     @ArucoMarkerCalibrator._handeye_calibration_decorator
-    def handeye_calibrate(self, image):
-        found, corners, ids = self.find_corners(image)
+    def handeye_calibrate(self, detection, camera_matrix, dist_coeffs):
+        found, corners, ids = detection
         
         if not found:
             return None
         
-        found, rvec, tvec = aruco.estimatePoseBoard(
-            corners, ids, self._board,
-            self._calibration_result["matrix"], 
-            self._calibration_result["distortion"], 
-            None, None)
+        # The board is planar: match the detections to board points and use the closed-form IPPE solver
+        obj_points, img_points = self._board.matchImagePoints(corners, ids)
+        if obj_points is None or len(obj_points) < 4:
+            return None
+
+        found, rvec, tvec = cv2.solvePnP(obj_points, img_points,
+                                         camera_matrix, dist_coeffs,
+                                         flags=cv2.SOLVEPNP_IPPE)
         
         if found:
             return cv2.Rodrigues(rvec)[0], tvec
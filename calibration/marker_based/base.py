@@ -1,7 +1,6 @@
-import cv2
 import numpy as np
 from pathlib import Path
-from typing import Union, List, Tuple
+from typing import Union, List, Tuple, Optional
 
 from cv2 import aruco
 from calibration import CameraBaseCalibrator
@@ -30,31 +29,72 @@ class ArucoMarkerCalibrator(CameraBaseCalibrator):
         image_folder: Union[str, Path],
         pattern_size: Tuple[int, int],
         aruco_dict_name: str = "5x5_250",
-        marker_length_mm: Union[float, int] = 25.0
+        marker_length_mm: Union[float, int] = 25.0,
+        use_lu: bool = True,
+        detector_params: Optional[aruco.DetectorParameters] = None
     ):
         """
         :param image_folder: Directory containing images
         :param pattern_size: Size of marker grid (cols, rows)
         :param aruco_dict_name: Name of the ArUco dictionary
         :param marker_length_mm: Physical marker size in mm
+        :param use_lu: Use LU instead of SVD decomposition in the calibration solver
+        :param detector_params: ArUco detector parameters (OpenCV defaults with sub-pixel corner refinement if None),
+                                see aruco3_detector_params() for high-resolution images
         """
         if not isinstance(aruco_dict_name, str):
             raise TypeError("aruco_dict_name must be a string")
 
+        if detector_params is not None and not isinstance(detector_params, aruco.DetectorParameters):
+            raise TypeError("detector_params must be a cv2.aruco.DetectorParameters or None")
+
         if not isinstance(marker_length_mm, (float, int)):
             raise TypeError("marker_length_mm must be a numeric value (float or int)")
 
-        super().__init__(image_folder, pattern_size)
+        super().__init__(image_folder, pattern_size, use_lu)
 
         self._aruco_dict_name = ""
         self._aruco_dict = None
         self.aruco_dict = aruco_dict_name
         self.marker_length_mm = marker_length_mm
 
-        self._params = aruco.DetectorParameters()
+        if detector_params is None:
+            detector_params = aruco.DetectorParameters()
+            # Sub-pixel corner refinement costs next to nothing and lowers the reprojection error
+            detector_params.cornerRefinementMethod = aruco.CORNER_REFINE_SUBPIX
+
+        self._params = detector_params
         self._detector = aruco.ArucoDetector(self._aruco_dict, self._params)
         self._board = None
 
+    @staticmethod
+    def aruco3_detector_params(
+        min_side_length_canonical: int = 32,
+        min_marker_length_ratio: float = 0.05
+    ) -> aruco.DetectorParameters:
+        """
+        Builds detector parameters with the Aruco3 fast detection enabled.
+        Markers are searched on a downscaled image, which speeds up detection
+        several times on 1080p/4K images. Markers smaller than the canonical
+        side are not detected, so keep the defaults for low-resolution images.
+
+        :param min_side_length_canonical: Marker side (px) in the downscaled search image
+        :param min_marker_length_ratio: Minimum marker side relative to the image size
+        :return: Configured cv2.aruco.DetectorParameters
+        """
+        if not isinstance(min_side_length_canonical, int) or min_side_length_canonical < 1:
+            raise ValueError("min_side_length_canonical must be a positive integer")
+
+        if not isinstance(min_marker_length_ratio, (float, int)) or not 0 <= min_marker_length_ratio < 1:
+            raise ValueError("min_marker_length_ratio must be a number in range [0, 1)")
+
+        params = aruco.DetectorParameters()
+        params.useAruco3Detection = True
+        params.cornerRefinementMethod = aruco.CORNER_REFINE_SUBPIX
+        params.minSideLengthCanonicalImg = min_side_length_canonical
+        params.minMarkerLengthRatioOriginalImg = float(min_marker_length_ratio)
+        return params
+
     @property
     def aruco_dict(self) -> str:
         return self._aruco_dict_name
@@ -72,6 +112,7 @@ class ArucoMarkerCalibrator(CameraBaseCalibrator):
 
         self._aruco_dict = aruco.getPredefinedDictionary(self.ARUCO_DICTS[value])
         self._aruco_dict_name = value
+        self._invalidate_detections()
 
     @property
     def marker_length_mm(self) -> Union[float, int]:
@@ -84,6 +125,7 @@ class ArucoMarkerCalibrator(CameraBaseCalibrator):
 
         self._marker_length_mm = value
         self._marker_lenght = value / 1000.0  # in meters
+        self._invalidate_detections()
 
     def find_corners(self, image: np.ndarray) -> FindArucoCornerResult:
         """
@@ -105,7 +147,8 @@ class ArucoMarkerCalibrator(CameraBaseCalibrator):
         self,
         error_msg: str,
         pattern: str = "*",
-        extend_corners: bool = True
+        extend_corners: bool = True,
+        n_threads: Optional[int] = None
     ) -> Tuple[List[np.ndarray], List[np.ndarray], List[int], ImageSize]:
         """
         Detects ArUco markers across all valid images.
@@ -113,6 +156,7 @@ class ArucoMarkerCalibrator(CameraBaseCalibrator):
         :param error_msg: Error to raise if not enough valid detections
         :param pattern: Glob pattern for file search
         :param extend_corners: Whether to flatten corners list across images
+        :param n_threads: Number of detection threads (defaults to the CPU count)
         :return: Tuple with detected corners, IDs, marker counts, and image size
         """
         if not isinstance(error_msg, str):
@@ -128,15 +172,18 @@ class ArucoMarkerCalibrator(CameraBaseCalibrator):
 
         img_size, image_paths = self._check_images_size(pattern=pattern)
 
-        for img_path in image_paths:
-            image = cv2.imread(str(img_path))
-            if image is None:
+        def detect_one(img_path: Path) -> Optional[FindArucoCornerResult]:
+            detection = self._detect(img_path)
+            if detection is None:
                 print(f"Failed to load image: {img_path}")
-                continue
 
-            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-            found, corners, ids = self.find_corners(gray)
+            return detection
+
+        for detection in self._map_images(detect_one, image_paths, workers=n_threads):
+            if detection is None:
+                continue
 
+            found, corners, ids = detection
             if found and corners is not None and ids is not None:
                 all_ids.append(ids)
                 counter.append(len(ids))
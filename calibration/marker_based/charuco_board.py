@@ -20,7 +20,9 @@ class CharucoBoardCalibrator(ArucoMarkerCalibrator):
         pattern_size: Tuple[int, int],
         aruco_dict_name: str = "5x5_250",
         marker_length_mm: Union[float, int] = 25.0,
-        pattern_length_mm: Union[float, int] = 40.0
+        pattern_length_mm: Union[float, int] = 40.0,
+        use_lu: bool = True,
+        detector_params: Optional[aruco.DetectorParameters] = None
     ):
         """
         :param image_folder: Directory containing calibration images
@@ -28,11 +30,14 @@ class CharucoBoardCalibrator(ArucoMarkerCalibrator):
         :param aruco_dict_name: ArUco dictionary name
         :param marker_length_mm: Side length of ArUco markers in mm
         :param pattern_length_mm: Length of ChArUco squares in mm
+        :param use_lu: Use LU instead of SVD decomposition in the calibration solver
+        :param detector_params: ArUco detector parameters (OpenCV defaults with sub-pixel corner refinement if None)
         """
         if not isinstance(pattern_length_mm, (float, int)):
             raise TypeError("pattern_length_mm must be a float or int")
 
-        super().__init__(image_folder, pattern_size, aruco_dict_name, marker_length_mm)
+        super().__init__(image_folder, pattern_size, aruco_dict_name, marker_length_mm,
+                         use_lu, detector_params)
 
         self.pattern_length_mm = pattern_length_mm  # triggers setter
 
@@ -56,6 +61,7 @@ class CharucoBoardCalibrator(ArucoMarkerCalibrator):
 
         self._pattern_length_mm = value
         self._pattern_length = self._pattern_length_mm / 1000.0
+        self._invalidate_detections()
 
     def find_corners(self, image: np.ndarray) -> FindArucoCornerResult:
         """
@@ -88,7 +94,8 @@ class CharucoBoardCalibrator(ArucoMarkerCalibrator):
         self,
         pattern: str = "*",
         camera_matrix: Optional[np.ndarray] = None,
-        dist_coeffs: Optional[np.ndarray] = None
+        dist_coeffs: Optional[np.ndarray] = None,
+        n_threads: Optional[int] = None
     ) -> Dict[str, Union[float, np.ndarray]]:
         """
         Calibrates the camera using detected ChArUco corners.
@@ -96,6 +103,7 @@ class CharucoBoardCalibrator(ArucoMarkerCalibrator):
         :param pattern: Glob pattern for image filenames
         :param camera_matrix: Optional initial camera matrix
         :param dist_coeffs: Optional initial distortion coefficients
+        :param n_threads: Number of detection threads (defaults to the CPU count)
         :return: Dictionary containing calibration result
         """
         if not isinstance(pattern, str):
@@ -104,7 +112,8 @@ class CharucoBoardCalibrator(ArucoMarkerCalibrator):
         all_corners, all_ids, _, img_size = self._preprocess_images(
             error_msg="Insufficient valid images with ChArUco markers for calibration",
             pattern=pattern,
-            extend_corners=False
+            extend_corners=False,
+            n_threads=n_threads
         )
 
         ret, mtx, dist, rvecs, tvecs = aruco.calibrateCameraCharuco(
@@ -113,7 +122,8 @@ class CharucoBoardCalibrator(ArucoMarkerCalibrator):
             board=self._board,
             imageSize=img_size,
             cameraMatrix=camera_matrix,
-            distCoeffs=dist_coeffs
+            distCoeffs=dist_coeffs,
+            flags=self._calibration_flags()
         )
 
         self._calibration_result = {
@@ -127,17 +137,20 @@ class CharucoBoardCalibrator(ArucoMarkerCalibrator):
         return self._calibration_result
 
     @ArucoMarkerCalibrator._handeye_calibration_decorator
-    def handeye_calibrate(self, image):
-        found, corners, ids = self.find_corners(image)
+    def handeye_calibrate(self, detection, camera_matrix, dist_coeffs):
+        found, corners, ids = detection
 
         if not found:
             return None
         
-        found, rvec, tvec = aruco.estimatePoseCharucoBoard(
-            corners, ids, self._board,
-            self._calibration_result["matrix"], 
-            self._calibration_result["distortion"], 
-            None, None)
+        # The board is planar: match the detections to board points and use the closed-form IPPE solver
+        obj_points, img_points = self._board.matchImagePoints(corners, ids)
+        if obj_points is None or len(obj_points) < 4:
+            return None
+
+        found, rvec, tvec = cv2.solvePnP(obj_points, img_points,
+                                         camera_matrix, dist_coeffs,
+                                         flags=cv2.SOLVEPNP_IPPE)
         
         if found:
             return cv2.Rodrigues(rvec)[0], tvec
@@ -20,12 +20,13 @@ class PatternBasedCalibrator(CameraBaseCalibrator):
         self,
         image_folder: Union[str, Path],
         pattern_size: Tuple[int, int],
-        pattern_length_mm: Union[float, int] = 40.0
+        pattern_length_mm: Union[float, int] = 40.0,
+        use_lu: bool = True
     ):
         if not isinstance(pattern_length_mm, (float, int)):
             raise TypeError("pattern_length_mm must be a float or int")
 
-        super().__init__(image_folder, pattern_size)
+        super().__init__(image_folder, pattern_size, use_lu)
         self.pattern_length_mm = pattern_length_mm
 
     @property
@@ -60,21 +61,17 @@ class PatternBasedCalibrator(CameraBaseCalibrator):
 
         :return: (N, 3) float32 numpy array of 3D points
         """
-        width, height = self._pattern_size
-        object_points = np.zeros((height * width, 3), dtype=np.float32)
-        object_points[:, :2] = (
-            np.mgrid[0:width, 0:height].T.reshape(-1, 2) * self._pattern_length
-        )
-        return object_points
+        return self._objp_template * self._pattern_length
 
     def _preprocess_images(
-        self, pattern: str = "*"
+        self, pattern: str = "*", n_threads: Optional[int] = None
     ) -> Tuple[ImageSize, List[ObjectPoints], List[ImagePoints]]:
         """
         Loads and processes calibration images, finds corners and associates
         them with corresponding 3D pattern points.
 
         :param pattern: File glob pattern for images
+        :param n_threads: Number of detection threads (defaults to the CPU count)
         :return: Image size, list of 3D object points, list of 2D image points
         """
         if not isinstance(pattern, str):
@@ -86,21 +83,25 @@ class PatternBasedCalibrator(CameraBaseCalibrator):
         objps = self._prepare_3d_points()
         img_size, image_paths = self._check_images_size(pattern=pattern)
 
-        for img_path in image_paths:
-            image = cv2.imread(str(img_path))
-            if image is None:
+        def detect_one(img_path: Path) -> Optional[ImagePoints]:
+            detection = self._detect(img_path)
+            if detection is None:
                 print(f"Failed to load image: {img_path.name}")
-                continue
+                return None
+
+            found, corners = detection
 
-            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+            if not found or corners is None:
+                print(f"No corners found in image: {img_path.name}")
+                return None
 
-            found, corners = self.find_corners(gray)
+            return corners
 
-            if found and corners is not None:
-                object_points.append(objps.copy())
+        for corners in self._map_images(detect_one, image_paths, workers=n_threads):
+            if corners is not None:
+                # OpenCV only reads the object points, so every view shares one array
+                object_points.append(objps)
                 image_points.append(corners)
-            else:
-                print(f"No corners found in image: {img_path.name}")
 
         if len(image_points) < 5:
             raise ValueError(
@@ -114,6 +115,7 @@ class PatternBasedCalibrator(CameraBaseCalibrator):
         pattern: str = "*",
         camera_matrix: Optional[CameraMatrix] = None,
         dist_coeffs: Optional[DistCoeffs] = None,
+        n_threads: Optional[int] = None,
     ) -> CalibrationResult:
         """
         Performs camera calibration based on loaded and processed images.
@@ -121,6 +123,7 @@ class PatternBasedCalibrator(CameraBaseCalibrator):
         :param pattern: Glob pattern for image selection
         :param camera_matrix: Optional initial guess for camera matrix
         :param dist_coeffs: Optional initial guess for distortion coefficients
+        :param n_threads: Number of detection threads (defaults to the CPU count)
         :return: Dictionary with calibration results
         """
         if not isinstance(pattern, str):
@@ -134,7 +137,7 @@ class PatternBasedCalibrator(CameraBaseCalibrator):
         if dist_coeffs is not None and not isinstance(dist_coeffs, np.ndarray):
             raise ValueError("dist_coeffs must be a numpy array")
 
-        img_size, object_points, image_points = self._preprocess_images(pattern=pattern)
+        img_size, object_points, image_points = self._preprocess_images(pattern=pattern, n_threads=n_threads)
 
         ret, mtx, dist, rvecs, tvecs = cv2.calibrateCamera(
             objectPoints=object_points,
@@ -142,6 +145,7 @@ class PatternBasedCalibrator(CameraBaseCalibrator):
             imageSize=img_size,
             cameraMatrix=camera_matrix,
             distCoeffs=dist_coeffs,
+            flags=self._calibration_flags(),
         )
 
         self._calibration_result = {
@@ -155,17 +159,19 @@ class PatternBasedCalibrator(CameraBaseCalibrator):
         return self._calibration_result
     
     @CameraBaseCalibrator._handeye_calibration_decorator
-    def handeye_calibrate(self, image):
-        found, corners = self.find_corners(image)
+    def handeye_calibrate(self, detection, camera_matrix, dist_coeffs):
+        found, corners = detection
         obj_points = self._prepare_3d_points()
 
         if not found:
             return None
         
+        # The pattern is planar, so the closed-form IPPE solver replaces the iterative one
         ret, rvec, tvec = cv2.solvePnP(obj_points,
                                        corners,
-                                       self._calibration_result["matrix"],
-                                       self._calibration_result["distortion"])
+                                       camera_matrix,
+                                       dist_coeffs,
+                                       flags=cv2.SOLVEPNP_IPPE)
 
         if ret:
             return cv2.Rodrigues(rvec)[0], tvec
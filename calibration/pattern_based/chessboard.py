@@ -12,19 +12,21 @@ class ChessboardCalibrator(PatternBasedCalibrator):
         self,
         image_folder: Union[str, Path],
         pattern_size: Tuple[int, int],
-        pattern_length_mm: Union[float, int] = 40
+        pattern_length_mm: Union[float, int] = 40,
+        use_lu: bool = True
     ):
         """
-        Chessboard calibrator using OpenCV's findChessboardCorners.
+        Chessboard calibrator using OpenCV's findChessboardCornersSB.
 
         :param image_folder: Path to directory containing calibration images
         :param pattern_size: Number of inner corners per chessboard row and column (cols, rows)
         :param pattern_length_mm: Square side length in millimeters
+        :param use_lu: Use LU instead of SVD decomposition in the calibration solver
         """
         if not isinstance(pattern_length_mm, (int, float)):
             raise TypeError("pattern_length_mm must be a float or int")
 
-        super().__init__(image_folder, pattern_size, pattern_length_mm)
+        super().__init__(image_folder, pattern_size, pattern_length_mm, use_lu)
 
     def find_corners(self, image: np.ndarray) -> FindCornersResult:
         """
@@ -39,20 +41,12 @@ class ChessboardCalibrator(PatternBasedCalibrator):
         if image.ndim != 2:
             raise ValueError("image must be a single-channel (grayscale) image")
 
-        criteria = (
-            cv2.TERM_CRITERIA_EPS + cv2.TERM_CRITERIA_MAX_ITER,
-            30,
-            0.001,
-        )
+        flags = cv2.CALIB_CB_NORMALIZE_IMAGE + cv2.CALIB_CB_EXHAUSTIVE + cv2.CALIB_CB_ACCURACY
 
-        flags = cv2.CALIB_CB_ADAPTIVE_THRESH + cv2.CALIB_CB_FAST_CHECK
-
-        found, corners = cv2.findChessboardCorners(image, self._pattern_size, flags)
+        # The sector-based detector refines corners itself, no cornerSubPix pass is needed
+        found, corners = cv2.findChessboardCornersSB(image, self._pattern_size, flags)
 
         if found and corners is not None:
-            corners = cv2.cornerSubPix(
-                image, corners, winSize=(11, 11), zeroZone=(-1, -1), criteria=criteria
-            )
             return True, corners
 
         return False, None
@@ -8,12 +8,17 @@ from calibration import PatternBasedCalibrator
 
 
 class CircleGridCalibrator(PatternBasedCalibrator):
+    # Larger images are searched for the grid at reduced resolution (blob detection dominates),
+    # the centers are then refined on the original image
+    MAX_DETECTION_SIDE = 1500
+
     def __init__(
         self,
         image_folder: Union[str, Path],
         pattern_size: Tuple[int, int],
         pattern_length_mm: Union[float, int] = 40,
-        asymmetric: bool = False
+        asymmetric: bool = False,
+        use_lu: bool = True
     ):
         """
         Circle grid calibrator supporting symmetric and asymmetric patterns.
@@ -25,11 +30,12 @@ class CircleGridCalibrator(PatternBasedCalibrator):
         :param pattern_size: Tuple (cols, rows) of the circle grid
         :param pattern_length_mm: Distance between circle centers in millimeters
         :param asymmetric: Whether the grid is asymmetric
+        :param use_lu: Use LU instead of SVD decomposition in the calibration solver
         """
         if not isinstance(asymmetric, bool):
             raise TypeError("asymmetric must be a boolean")
 
-        super().__init__(image_folder, pattern_size, pattern_length_mm)
+        super().__init__(image_folder, pattern_size, pattern_length_mm, use_lu)
         self.asymmetric = asymmetric
 
     @property
@@ -41,6 +47,7 @@ class CircleGridCalibrator(PatternBasedCalibrator):
         if not isinstance(value, bool):
             raise ValueError("asymmetric must be a boolean")
         self._asymmetric = value
+        self._invalidate_detections()
 
     # TODO: Необходимо почитать подробнее про калибровку маркеров
     # def _prepare_3d_points(self) -> ObjectPoints:
@@ -71,6 +78,21 @@ class CircleGridCalibrator(PatternBasedCalibrator):
     #         )
     #         return objp
 
+    @staticmethod
+    def _scaled_blob_detector(scale: float) -> cv2.SimpleBlobDetector:
+        """
+        Creates the default findCirclesGrid blob detector with its size limits adapted to an image
+        downscaled by the given factor, so it accepts the same circles as on the original image.
+
+        :param scale: Ratio of the original to the downscaled image size
+        :return: Configured SimpleBlobDetector
+        """
+        params = cv2.SimpleBlobDetector_Params()
+        params.minArea /= scale ** 2
+        params.maxArea /= scale ** 2
+        params.minDistBetweenBlobs /= scale
+        return cv2.SimpleBlobDetector_create(params)
+
     def find_corners(self, image: np.ndarray) -> FindCornersResult:
         """
         Detects circle grid pattern in the image.
@@ -90,8 +112,23 @@ class CircleGridCalibrator(PatternBasedCalibrator):
         if self._asymmetric:
             flags = cv2.CALIB_CB_ASYMMETRIC_GRID
 
-        found, corners = cv2.findCirclesGrid(image, self._pattern_size, None, flags)
-        
+        height, width = image.shape
+        scale = max(height, width) / self.MAX_DETECTION_SIDE
+        found, corners = False, None
+        if scale > 1:
+            small = cv2.resize(image, (round(width / scale), round(height / scale)),
+                               interpolation=cv2.INTER_AREA)
+            found, corners = cv2.findCirclesGrid(small, self._pattern_size, None, flags,
+                                                 blobDetector=self._scaled_blob_detector(scale))
+            if found and corners is not None:
+                # Per-axis ratios (rounding makes them differ), pixel centers mapped with the half-pixel offset
+                ratio = np.array([width / small.shape[1], height / small.shape[0]], dtype=np.float32)
+                corners = (corners + np.float32(0.5)) * ratio - np.float32(0.5)
+
+        if not found or corners is None:
+            # Small images, and grids the reduced search missed, are searched at full resolution
+            found, corners = cv2.findCirclesGrid(image, self._pattern_size, None, flags)
+
         if found and corners is not None:
             corners = cv2.cornerSubPix(image, corners, (11, 11), (-1, -1), criteria)
             return True, corners
@@ -18,3 +18,4 @@ CalibrationResult = Dict[str, Any]
 ArucoIds = Union[np.ndarray, List[np.ndarray]]                                          # shape: (N, 1), dtype=int32
 FindCornersResult = Tuple[bool, Optional[np.ndarray]]                                   # (success, angles)
 FindArucoCornerResult = Tuple[bool, Optional[np.ndarray], Optional[np.ndarray]]         # (success, angles, id)
+FileSignature = Tuple[int, int, int, int]                                               # (st_dev, st_ino, st_mtime_ns, st_size)
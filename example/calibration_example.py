@@ -3,7 +3,8 @@ from calibration import (ChessboardCalibrator,
                         CircleGridCalibrator, 
                         ArucoBoardCalibrator,
                         CharucoBoardCalibrator)
-from typing import Tuple, List
+from functools import partial
+from typing import Callable, Tuple
 
 def generate_gripper_positions(
     num_positions: int = 10,
@@ -14,7 +15,7 @@ def generate_gripper_positions(
     pitch_limits: Tuple[float, float] = (-np.pi/4, np.pi/4),
     yaw_limits: Tuple[float, float] = (-np.pi/2, np.pi/2),
     seed: int = None
-) -> List[Tuple[float, float, float, float, float, float]]:
+) -> np.ndarray:
     """
     Генерирует список случайных позиций gripper в заданных пределах
     
@@ -29,23 +30,11 @@ def generate_gripper_positions(
         seed: Seed для генератора случайных чисел
         
     Returns:
-        Список кортежей (x, y, z, roll, pitch, yaw)
+        Массив (num_positions, 6) float64 из строк (x, y, z, roll, pitch, yaw)
     """
-    if seed is not None:
-        np.random.seed(seed)
-    
-    positions = []
-    for _ in range(num_positions):
-        x = np.random.uniform(*x_limits)
-        y = np.random.uniform(*y_limits)
-        z = np.random.uniform(*z_limits)
-        roll = np.random.uniform(*roll_limits)
-        pitch = np.random.uniform(*pitch_limits)
-        yaw = np.random.uniform(*yaw_limits)
-        
-        positions.append((x, y, z, roll, pitch, yaw))
-    
-    return positions
+    rng = np.random.default_rng(seed)
+    limits = np.array([x_limits, y_limits, z_limits, roll_limits, pitch_limits, yaw_limits], dtype=float)
+    return rng.uniform(limits[:, 0], limits[:, 1], size=(num_positions, 6))
 
 
 checker_folder = "/home/daniel/dev/docker_dev/web_service/calibration_module/images/checker"
@@ -55,6 +44,15 @@ aruco_folder = "/home/daniel/dev/docker_dev/web_service/calibration_module/image
 charuco_folder = "/home/daniel/dev/docker_dev/web_service/calibration_module/images/handeye"
 
 
+DEFAULT_LIMITS = dict(
+    x_limits=(0.05, 0.15),    # X от 5см до 15см
+    y_limits=(0.15, 0.25),    # Y от 15см до 25см
+    z_limits=(0.25, 0.35),    # Z от 25см до 35см
+    roll_limits=(0.0, 0.2),   # Roll от 0 до 0.2 рад (~11.5°)
+    pitch_limits=(-0.1, 0.1), # Pitch от -0.1 до 0.1 рад (~±5.7°)
+    yaw_limits=(0.1, 0.3),    # Yaw от 0.1 до 0.3 рад (~5.7°-17.2°)
+)
+
 pattern_size = (5, 7)
 square_length_mm = 40
 marker_length_mm = 25
@@ -87,179 +85,107 @@ charuco_calibrator = CharucoBoardCalibrator(image_folder=charuco_folder,
                                            marker_length_mm=40)
 
 
-print("Chessboard калибровка")
-try:
-    chessboard_result = chessboard_calibrator.calibrate(pattern="*.jpg")
-    # chessboard_calibrator.save_calibration_result(output_path="./chessboard.npz")
-    print("Точность калибровки:", chessboard_result["ret"])
-    print("Матрица камеры:", chessboard_result["matrix"].tolist())
-    print("Дисторсия:", chessboard_result["distortion"])
-except Exception as e:
-    print(e)
-print()
-
-print("Circle asym калибровка")
-try:
-    circle_async_result = circle_asym_calibrator.calibrate(pattern="*.jpg")
-    print("Точность калибровки:", circle_async_result["ret"])
-    print("Матрица камеры:", circle_async_result["matrix"].tolist())
-    print("Дисторсия:", circle_async_result["distortion"])
-except Exception as e:
-    print(e)
-print()
-
-print("Circle sym калибровка")
-try:
-    circle_sync_result = circle_sym_calibrator.calibrate(pattern="*.jpg")
-    print("Точность калибровки:", circle_sync_result["ret"])
-    print("Матрица камеры:", circle_sync_result["matrix"].tolist())
-    print("Дисторсия:", circle_sync_result["distortion"])
-except Exception as e:
-    print(e)
-print()
-
-print("Aruco калибровка")
-try:
-    aruco_result = aruco_calibrator.calibrate(pattern="*.jpg")
-    # aruco_calibrator.save_calibration_result(output_path="./aruco.txt")
-    print("Точность калибровки:", aruco_result["ret"])
-    print("Матрица камеры:", aruco_result["matrix"].tolist())
-    print("Дисторсия:", aruco_result["distortion"])
-except Exception as e:
-    print(e)
-print()
-
-print("Charuco калибровка")
-try:
-    charuco_result = charuco_calibrator.calibrate(pattern="*.jpg")
-    charuco_calibrator.save_calibration_result(output_path="./charuco.npz")
-    charuco_result = charuco_calibrator.load_calibration_result("./charuco.npz")
-    print("Точность калибровки:", charuco_result["ret"])
-    print("Матрица камеры:", charuco_result["matrix"].tolist())
-    print("Дисторсия:", charuco_result["distortion"])
-except Exception as e:
-    print(e)
-print()
+def calibrate_and_save(calibrator, output_path: str):
+    calibrator.calibrate(pattern="*.jpg")
+    calibrator.save_calibration_result(output_path=output_path, compress=True)  # для последующих запусков
+    return calibrator.calibration_result
+
+
+def report_calibration(name: str, calibrate: Callable[[], dict]):
+    """Выполняет калибровку и печатает её результат или ошибку, если она не удалась"""
+    print(f"{name} калибровка")
+    try:
+        result = calibrate()
+    except Exception as e:
+        print(e)
+        return None
+
+    print("Точность калибровки:", result["ret"])
+    print("Матрица камеры:\n", result["matrix"])
+    print("Дисторсия:", result["distortion"])
+    return result
+
+
+def run_handeye(name: str, calibrator, image_folder: str, gripper_poses, intrinsics, **kwargs):
+    """Выполняет handeye калибровку с заданными внутренними параметрами и печатает результат"""
+    print(f"{name} handeye калибровка")
+    calibrator.image_folder = image_folder
+    R_cam2gripper, t_cam2gripper = calibrator.handeye_calibrate(gripper_poses=gripper_poses,
+                                                                pattern="*.jpg",
+                                                                camera_matrix=intrinsics["matrix"],
+                                                                dist_coeffs=intrinsics["distortion"],
+                                                                **kwargs)
+    print("Матрица вращения (камера -> gripper):\n", R_cam2gripper)
+    print("Вектор перемещения (камера -> gripper):\n", t_cam2gripper)
+    return R_cam2gripper, t_cam2gripper
+
+
+# Калибровки выполняются по очереди: каждая уже распараллеливает детекцию по всем ядрам,
+# а сообщения о пропущенных изображениях выводятся под заголовком своей калибровки
+calibrations = {
+    "Chessboard": partial(chessboard_calibrator.calibrate, pattern="*.jpg"),
+    "Circle asym": partial(circle_asym_calibrator.calibrate, pattern="*.jpg"),
+    "Circle sym": partial(circle_sym_calibrator.calibrate, pattern="*.jpg"),
+    "Aruco": partial(aruco_calibrator.calibrate, pattern="*.jpg"),
+    "Charuco": partial(calibrate_and_save, charuco_calibrator, "./charuco.npz"),
+}
+
+for name, calibrate in calibrations.items():
+    report_calibration(name, calibrate)
+    print()
  
 
-print("Charuco handeye калибровка")
-gripper_positions = generate_gripper_positions(
-    num_positions=20,
-    x_limits=(0.05, 0.15),    # X от 5см до 15см
-    y_limits=(0.15, 0.25),    # Y от 15см до 25см
-    z_limits=(0.25, 0.35),    # Z от 25см до 35см
-    roll_limits=(0.0, 0.2),   # Roll от 0 до 0.2 рад (~11.5°)
-    pitch_limits=(-0.1, 0.1), # Pitch от -0.1 до 0.1 рад (~±5.7°)
-    yaw_limits=(0.1, 0.3),    # Yaw от 0.1 до 0.3 рад (~5.7°-17.2°)
-    seed=42  # Фиксированный seed для воспроизводимости
-)
-
-gripper_positions = [
-    (430/1000, -0.03/1000, 645/1000, np.deg2rad(180), np.deg2rad(-25.28), np.deg2rad(-180)), #21
-    (556/1000, 7.77/1000, 509/1000, np.deg2rad(180), np.deg2rad(-25.28), np.deg2rad(-180)), #22
-    (446/1000, 7.78/1000, 509/1000, np.deg2rad(180), np.deg2rad(-25.28), np.deg2rad(-180)), #23
-    (552/1000, 65.42/1000, 509/1000, np.deg2rad(180), np.deg2rad(-25.28), np.deg2rad(-180)), #24
-    (464/1000, -131/1000, 509/1000, np.deg2rad(180), np.deg2rad(-25.28), np.deg2rad(-180)), #25
-    (464/1000, 48/1000, 509/1000, np.deg2rad(180), np.deg2rad(-25.28), np.deg2rad(-180)), #26
-    (567/1000, 48/1000, 509/1000, np.deg2rad(180), np.deg2rad(-25.28), np.deg2rad(-180)), #27
-    (567/1000, -123/1000, 508/1000, np.deg2rad(180), np.deg2rad(-25.28), np.deg2rad(-180)), #28
-    (567/1000, -59/1000, 467/1000, np.deg2rad(180), np.deg2rad(-25.28), np.deg2rad(-180)), #29
-    (567/1000, 20/1000, 467/1000, np.deg2rad(180), np.deg2rad(-25.28), np.deg2rad(-180)), #30
-    (462/1000, 20/1000, 467/1000, np.deg2rad(180), np.deg2rad(-25.28), np.deg2rad(-180)), #31
-    (462/1000, -88/1000, 467/1000, np.deg2rad(180), np.deg2rad(-25.28), np.deg2rad(-180)), #32
-    (462/1000, -88/1000, 467/1000, np.deg2rad(180), np.deg2rad(-25.28), np.deg2rad(-180)), #33
-    (462/1000, -192/1000, 614/1000, np.deg2rad(180), np.deg2rad(-25.28), np.deg2rad(-180)), #34
-    (462/1000, 143/1000, 614/1000, np.deg2rad(180), np.deg2rad(-25.28), np.deg2rad(-180)), #35
-    (462/1000, -46/1000, 614/1000, np.deg2rad(180), np.deg2rad(-25.28), np.deg2rad(-180)), #36
-    (525/1000, -46/1000, 614/1000, np.deg2rad(180), np.deg2rad(-25.28), np.deg2rad(-180)), #37
-    (389/1000, -46/1000, 614/1000, np.deg2rad(180), np.deg2rad(-25.28), np.deg2rad(-180)), #38
-    (389/1000, -173/1000, 614/1000, np.deg2rad(180), np.deg2rad(-25.28), np.deg2rad(-180)), #39
-    (389/1000, 102/1000, 614/1000, np.deg2rad(180), np.deg2rad(-25.28), np.deg2rad(-180)), #40
-]
-
-charuco_calibrator.image_folder = "./images/handeye"
-charuco_calibrator.load_calibration_result("./charuco.npz")
-R_cam2gripper, t_cam2gripper = charuco_calibrator.handeye_calibrate(gripper_poses=gripper_positions,
-                                                                    pattern="*.jpg")
+# Внутренние параметры камеры берутся из памяти и передаются всем калибраторам,
+# с диска - только если Charuco калибровка в этом запуске не удалась
+intrinsics = charuco_calibrator.calibration_result
+if intrinsics is None:
+    intrinsics = charuco_calibrator.load_calibration_result("./charuco.npz")
 
-print("Матрица вращения (камера -> gripper):\n", R_cam2gripper)
-print("Вектор перемещения (камера -> gripper):\n", t_cam2gripper)
-print("Determinant R:", np.linalg.det(R_cam2gripper))
-print()
-
-print("Aruco handeye калибровка")
-gripper_positions = generate_gripper_positions(
+# Одинаковый набор случайных поз для всех досок, кроме Charuco (реальные позы робота)
+default_positions = generate_gripper_positions(
     num_positions=10,
-    x_limits=(0.05, 0.15),    # X от 5см до 15см
-    y_limits=(0.15, 0.25),    # Y от 15см до 25см
-    z_limits=(0.25, 0.35),    # Z от 25см до 35см
-    roll_limits=(0.0, 0.2),   # Roll от 0 до 0.2 рад (~11.5°)
-    pitch_limits=(-0.1, 0.1), # Pitch от -0.1 до 0.1 рад (~±5.7°)
-    yaw_limits=(0.1, 0.3),    # Yaw от 0.1 до 0.3 рад (~5.7°-17.2°)
+    **DEFAULT_LIMITS,
     seed=42  # Фиксированный seed для воспроизводимости
 )
-aruco_calibrator.image_folder = "./images/aruco"
-aruco_calibrator.load_calibration_result("./charuco.npz")
-R_cam2gripper, t_cam2gripper = aruco_calibrator.handeye_calibrate(gripper_poses=gripper_positions,
-                                                                    pattern="*.jpg", 
-                                                                    calib_method="HORAUD")
-print("Матрица вращения (камера -> gripper):\n", R_cam2gripper)
-print("Вектор перемещения (камера -> gripper):\n", t_cam2gripper)
-print()
 
-print("Chessboard handeye калибровка")
-gripper_positions = generate_gripper_positions(
-    num_positions=10,
-    x_limits=(0.05, 0.15),    # X от 5см до 15см
-    y_limits=(0.15, 0.25),    # Y от 15см до 25см
-    z_limits=(0.25, 0.35),    # Z от 25см до 35см
-    roll_limits=(0.0, 0.2),   # Roll от 0 до 0.2 рад (~11.5°)
-    pitch_limits=(-0.1, 0.1), # Pitch от -0.1 до 0.1 рад (~±5.7°)
-    yaw_limits=(0.1, 0.3),    # Yaw от 0.1 до 0.3 рад (~5.7°-17.2°)
-    seed=42  # Фиксированный seed для воспроизводимости
-)
-chessboard_calibrator.image_folder = "./images/checker"
-chessboard_calibrator.load_calibration_result("./charuco.npz")
-R_cam2gripper, t_cam2gripper = chessboard_calibrator.handeye_calibrate(gripper_poses=gripper_positions,
-                                                                        pattern="*.jpg",)
-print("Матрица вращения (камера -> gripper):\n", R_cam2gripper)
-print("Вектор перемещения (камера -> gripper):\n", t_cam2gripper)
+# Ориентация фланца одинакова во всех позах, координаты в метрах
+ROLL, PITCH, YAW = np.deg2rad([180.0, -25.28, -180.0])
+gripper_positions = np.array([
+    (0.43, -3e-05, 0.645, ROLL, PITCH, YAW), #21
+    (0.556, 0.00777, 0.509, ROLL, PITCH, YAW), #22
+    (0.446, 0.00778, 0.509, ROLL, PITCH, YAW), #23
+    (0.552, 0.06542, 0.509, ROLL, PITCH, YAW), #24
+    (0.464, -0.131, 0.509, ROLL, PITCH, YAW), #25
+    (0.464, 0.048, 0.509, ROLL, PITCH, YAW), #26
+    (0.567, 0.048, 0.509, ROLL, PITCH, YAW), #27
+    (0.567, -0.123, 0.508, ROLL, PITCH, YAW), #28
+    (0.567, -0.059, 0.467, ROLL, PITCH, YAW), #29
+    (0.567, 0.02, 0.467, ROLL, PITCH, YAW), #30
+    (0.462, 0.02, 0.467, ROLL, PITCH, YAW), #31
+    (0.462, -0.088, 0.467, ROLL, PITCH, YAW), #32
+    (0.462, -0.088, 0.467, ROLL, PITCH, YAW), #33
+    (0.462, -0.192, 0.614, ROLL, PITCH, YAW), #34
+    (0.462, 0.143, 0.614, ROLL, PITCH, YAW), #35
+    (0.462, -0.046, 0.614, ROLL, PITCH, YAW), #36
+    (0.525, -0.046, 0.614, ROLL, PITCH, YAW), #37
+    (0.389, -0.046, 0.614, ROLL, PITCH, YAW), #38
+    (0.389, -0.173, 0.614, ROLL, PITCH, YAW), #39
+    (0.389, 0.102, 0.614, ROLL, PITCH, YAW), #40
+], dtype=np.float64)
+
+R_cam2gripper, _ = run_handeye("Charuco", charuco_calibrator, "./images/handeye",
+                               gripper_positions, intrinsics)
+print("Determinant R:", np.linalg.det(R_cam2gripper))
 print()
 
-print("Circle asym handeye калибровка")
-gripper_positions = generate_gripper_positions(
-    num_positions=10,
-    x_limits=(0.05, 0.15),    # X от 5см до 15см
-    y_limits=(0.15, 0.25),    # Y от 15см до 25см
-    z_limits=(0.25, 0.35),    # Z от 25см до 35см
-    roll_limits=(0.0, 0.2),   # Roll от 0 до 0.2 рад (~11.5°)
-    pitch_limits=(-0.1, 0.1), # Pitch от -0.1 до 0.1 рад (~±5.7°)
-    yaw_limits=(0.1, 0.3),    # Yaw от 0.1 до 0.3 рад (~5.7°-17.2°)
-    seed=42  # Фиксированный seed для воспроизводимости
-)
-circle_asym_calibrator.image_folder = "./images/circle_async"
-circle_asym_calibrator.load_calibration_result("./charuco.npz")
-R_cam2gripper, t_cam2gripper = circle_asym_calibrator.handeye_calibrate(gripper_poses=gripper_positions,
-                                                                        pattern="*.jpg")
-print("Матрица вращения (камера -> gripper):\n", R_cam2gripper)
-print("Вектор перемещения (камера -> gripper):\n", t_cam2gripper)
+run_handeye("Aruco", aruco_calibrator, "./images/aruco",
+            default_positions, intrinsics, calib_method="HORAUD")
 print()
 
-print("Circle sym handeye калибровка")
-gripper_positions = generate_gripper_positions(
-    num_positions=10,
-    x_limits=(0.05, 0.15),    # X от 5см до 15см
-    y_limits=(0.15, 0.25),    # Y от 15см до 25см
-    z_limits=(0.25, 0.35),    # Z от 25см до 35см
-    roll_limits=(0.0, 0.2),   # Roll от 0 до 0.2 рад (~11.5°)
-    pitch_limits=(-0.1, 0.1), # Pitch от -0.1 до 0.1 рад (~±5.7°)
-    yaw_limits=(0.1, 0.3),    # Yaw от 0.1 до 0.3 рад (~5.7°-17.2°)
-    seed=42  # Фиксированный seed для воспроизводимости
-)
-circle_sym_calibrator.image_folder = "./images/circle_sync"
-circle_sym_calibrator.load_calibration_result("./charuco.npz")
-R_cam2gripper, t_cam2gripper = circle_sym_calibrator.handeye_calibrate(gripper_poses=gripper_positions,
-                                                                        pattern="*.jpg")
-print("Матрица вращения (камера -> gripper):\n", R_cam2gripper)
-print("Вектор перемещения (камера -> gripper):\n", t_cam2gripper)
-print()
\ No newline at end of file
+for name, calibrator, image_folder in (
+    ("Chessboard", chessboard_calibrator, "./images/checker"),
+    ("Circle asym", circle_asym_calibrator, "./images/circle_async"),
+    ("Circle sym", circle_sym_calibrator, "./images/circle_sync"),
+):
+    run_handeye(name, calibrator, image_folder, default_positions, intrinsics)
+    print()
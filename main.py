@@ -1,14 +1,58 @@
 import os
+import re
 import cv2
 import sys
+import shutil
+import socket
+import stat
+import time
 import paramiko
+import queue
+import threading
 import numpy as np
 
-from typing import List
-from fnmatch import fnmatch
+from fnmatch import translate
+from functools import partial
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+
+
+class _ProgressWriter:
+    """Обёртка над локальным файлом: каждая запись сообщает о числе записанных байт"""
+
+    def __init__(self, file, on_progress: Callable[[int], None]):
+        self._file = file
+        self._on_progress = on_progress
+
+    def write(self, data) -> int:
+        # Небуферизованный файл может записать блок не целиком, остаток дописывается
+        view = memoryview(data)
+        while view:
+            view = view[self._file.write(view):]
+        self._on_progress(len(data))
+        return len(data)
 
 
 class RemoteConnection:
+    __slots__ = ("_hostname", "_port", "_username", "_password",
+                 "_ssh", "_sftp", "_connected",
+                 "_last_progress_ts", "_last_progress_pct")
+
+    # Максимальный размер данных в одном SFTP-пакете
+    CHUNK_SIZE = 32768
+    # Размер буфера копирования при скачивании в файл
+    COPY_BUFFER_SIZE = 1024 * 1024
+    # Число параллельных SFTP-каналов поверх одного SSH-соединения (MaxSessions sshd по умолчанию 10)
+    MAX_CHANNELS = 8
+    # Минимальный интервал между перерисовками прогресс-бара, с
+    PROGRESS_INTERVAL = 0.05
+    # Окно SSH-канала и максимальный размер пакета, объявляемые серверу
+    WINDOW_SIZE = 2 ** 27
+    MAX_PACKET_SIZE = 2 ** 19
+    # Интервал keepalive-пакетов, с
+    KEEPALIVE_INTERVAL = 30
+
     def __init__(self, 
                  hostname: str,
                  port: int,
@@ -24,63 +68,73 @@ class RemoteConnection:
         self._ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
         
         self._connected = False
+        self._sftp = None
+        self._last_progress_ts = 0.0
+        self._last_progress_pct = -1
+
+    def __enter__(self) -> "RemoteConnection":
+        self.ssh_connect()
+        return self
 
-    def __del__(self):
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
         self.ssh_disconnect()
     
     @property
     def hostname(self) -> str:
-        return self.__hostname
+        return self._hostname
     
     @property
     def port(self) -> int:
-        return self.__port
+        return self._port
     
     @property
     def username(self) -> str:
-        return self.__username
+        return self._username
     
     @property
     def password(self) -> str:
-        return self.__password
+        return self._password
     
     @hostname.setter
     def hostname(self, value: str):
         if not isinstance(value, str) or not value:
             raise ValueError("hostname должен быть непустой строкой")
         
-        self.__hostname = value
+        self._hostname = value
     
     @port.setter
     def port(self, value: int):
         if not isinstance(value, int) or not (0 < value < 65536):
             raise ValueError("port должен быть числом от 1 до 65535")
         
-        self.__port = value
+        self._port = value
     
     @username.setter
     def username(self, value: str):
         if not isinstance(value, str) or not value:
             raise ValueError("username должен быть непустой строкой")
         
-        self.__username = value
+        self._username = value
     
     @password.setter
     def password(self, value: str):
         if not isinstance(value, str):
             raise ValueError("password должен быть строкой")
         
-        self.__password = value
+        self._password = value
 
-    def _match_pattern(self, filename: str, pattern: str) -> bool:
+    def _compile_pattern(self, pattern: str) -> Optional[re.Pattern]:
+        """Компилирует маску один раз на вызов; None означает, что подходит любое имя"""
         pattern = pattern.strip()
         if pattern == "*":
-            return True
-        if pattern.startswith("*."):
-            return fnmatch(filename, pattern)
+            return None
         if "." in pattern:
-            return fnmatch(filename, pattern)
-        return filename == pattern
+            return re.compile(translate(pattern))
+        return re.compile(re.escape(pattern) + r"\Z")
+
+    def _match_pattern(self, filename: str, pattern: str) -> bool:
+        compiled = self._compile_pattern(pattern)
+        return compiled is None or compiled.match(filename) is not None
 
     def _print_progress_bar(self, 
                         current: int, 
@@ -88,6 +142,15 @@ class RemoteConnection:
                         prefix: str = "", 
                         bar_width: int = 10):
         percent = int(current / total * 100) if total > 0 else 100
+        now = time.monotonic()
+        # Перерисовка не чаще PROGRESS_INTERVAL, если процент не изменился; финальное значение выводится всегда
+        if (now - self._last_progress_ts < self.PROGRESS_INTERVAL
+                and percent == self._last_progress_pct
+                and current != total):
+            return
+        self._last_progress_ts = now
+        self._last_progress_pct = percent
+
         blocks = int(percent / (100 / bar_width))
         bar = "█" * blocks + "-" * (bar_width - blocks)
         sys.stdout.write(f"\r{prefix} [{bar}] {percent}% ({current}/{total} bytes)")
@@ -95,28 +158,148 @@ class RemoteConnection:
 
 
 
+    def _get_sftp(self) -> paramiko.SFTPClient:
+        # Один служебный SFTP-канал на соединение, переиспользуется всеми методами
+        if self._sftp is None:
+            self._sftp = self._ssh.open_sftp()
+        return self._sftp
+
+    @contextmanager
+    def _sftp_pool(self, size: int):
+        channels = queue.Queue()
+        try:
+            for _ in range(size):
+                channels.put(self._ssh.open_sftp())
+            yield channels
+        finally:
+            while not channels.empty():
+                channels.get_nowait().close()
+
+    def _progress_counter(self, total: int, prefix: str) -> Callable[[int], None]:
+        lock = threading.Lock()
+        done = 0
+
+        def on_progress(nbytes: int) -> None:
+            nonlocal done
+            with lock:
+                done += nbytes
+                self._print_progress_bar(done, total, prefix=prefix, bar_width=50)
+
+        return on_progress
+
+    def _is_up_to_date(self, local_path: str, attr: paramiko.SFTPAttributes) -> bool:
+        """Локальная копия считается актуальной, если совпадает размер и она не старше удалённого файла"""
+        try:
+            local_stat = os.stat(local_path)
+        except FileNotFoundError:
+            return False
+        return (attr.st_mtime is not None
+                and local_stat.st_size == attr.st_size
+                and int(local_stat.st_mtime) >= int(attr.st_mtime))
+
+    def _download_one(self, sftp, remote_path: str, local_path: str, size: Optional[int], on_progress,
+                      mtime: Optional[int] = None) -> None:
+        # Файл пишется во временный .part и подменяет local_path только после полной копии,
+        # чтобы прерванная загрузка не выглядела уже скачанным файлом
+        part_path = local_path + ".part"
+        try:
+            # Блоки по COPY_BUFFER_SIZE пишутся напрямую в дескриптор, без промежуточного BufferedWriter
+            with sftp.open(remote_path, "rb") as remote_file, open(part_path, "wb", buffering=0) as local_file:
+                if size and hasattr(os, "posix_fallocate"):
+                    # Место под файл выделяется сразу целиком
+                    try:
+                        os.posix_fallocate(local_file.fileno(), 0, size)
+                    except OSError:
+                        pass
+                # Запросы на чтение всего файла отправляются сразу, а не по одному на блок
+                remote_file.prefetch(size)
+                shutil.copyfileobj(remote_file, _ProgressWriter(local_file, on_progress), self.COPY_BUFFER_SIZE)
+                written = local_file.tell()
+                if size is not None and written != size:
+                    raise IOError(f"получено {written} из {size} байт")
+                if hasattr(os, "posix_fadvise"):
+                    # Записанные страницы не держатся в кэше ядра и не вытесняют рабочие данные.
+                    # Грязные страницы ядро не сбрасывает, поэтому сначала данные записываются на диск:
+                    # каждый файл ждёт fdatasync, зато после загрузки он уже сохранён
+                    os.fdatasync(local_file.fileno())
+                    os.posix_fadvise(local_file.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+            if mtime is not None:
+                # Время изменения как у удалённого файла, чтобы следующий запуск мог пропустить копию
+                os.utime(part_path, (mtime, mtime))
+            os.replace(part_path, local_path)
+        except BaseException:
+            try:
+                os.unlink(part_path)
+            except OSError:
+                pass
+            raise
+
+    def _load_one(self, sftp, remote_path: str, size: int, on_progress) -> bytes:
+        # Буфер выделяется один раз под известный размер, блоки читаются прямо в него
+        buffer = bytearray(size)
+        view = memoryview(buffer)
+        offset = 0
+        with sftp.open(remote_path, "rb") as remote_file:
+            remote_file.prefetch(size)
+            while offset < size:
+                n = remote_file.readinto(view[offset:offset + self.CHUNK_SIZE])
+                if not n:
+                    break
+                offset += n
+                on_progress(n)
+        view.release()
+        return bytes(buffer) if offset == size else bytes(buffer[:offset])
+
+    def _run_on_channels(self, jobs: List, worker: Callable) -> List:
+        """Распределяет задания по пулу SFTP-каналов, каждый поток работает со своим каналом"""
+        n_channels = min(len(jobs), self.MAX_CHANNELS)
+
+        with self._sftp_pool(n_channels) as channels:
+            def run(job):
+                sftp = channels.get()
+                try:
+                    return worker(sftp, *job)
+                finally:
+                    channels.put(sftp)
+
+            with ThreadPoolExecutor(max_workers=n_channels) as executor:
+                return list(executor.map(run, jobs))
+
     def ssh_connect(self) -> None:
         if self._connected:
             return
 
         self._ssh.connect(
-            hostname=self.__hostname,
-            port=self.__port,
-            username=self.__username,
-            password=self.__password
+            hostname=self._hostname,
+            port=self._port,
+            username=self._username,
+            password=self._password,
+            transport_factory=partial(paramiko.Transport,
+                                      default_window_size=self.WINDOW_SIZE,
+                                      default_max_packet_size=self.MAX_PACKET_SIZE)
         )
+
+        transport = self._ssh.get_transport()
+        transport.set_keepalive(self.KEEPALIVE_INTERVAL)
+        # Без алгоритма Нейгла мелкие SFTP-запросы уходят сразу, а не ждут подтверждения
+        transport.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
         self._connected = True
-        print(f"✅ Установлено SSH-соединение с {self.__hostname}")
+        print(f"✅ Установлено SSH-соединение с {self._hostname}")
 
     def ssh_disconnect(self) -> None:
         if self._connected:
+            if self._sftp is not None:
+                self._sftp.close()
+                self._sftp = None
             self._ssh.close()
             self._connected = False
-            print(f"🔌 SSH-соединение с {self.__hostname} закрыто")
+            print(f"🔌 SSH-соединение с {self._hostname} закрыто")
     
     def search_files(self,
                      remote_dir: str,
-                     extensions: List[str]) -> List[str]:
+                     extensions: List[str],
+                     recursive: bool = True) -> List[str]:
         
         if not self._connected:
             self.ssh_connect()
@@ -124,17 +307,38 @@ class RemoteConnection:
         if not extensions:
             raise ValueError("Список расширений не должен быть пустым")
         
-        ext_cond = " -o ".join([f"-iname '*.{ext.lstrip('.')}'" for ext in extensions])
-        find_command = f"find {remote_dir} '(' {ext_cond} ')'"
-
-        stdin, stdout, stderr = self._ssh.exec_command(find_command)
-        output = stdout.read().decode().splitlines()
-        errors = stderr.read().decode()
-
-        if errors:
-            print("⚠️ Ошибки при поиске файлов:", errors)
+        return list(self._find_files(remote_dir, extensions, recursive))
+
+    def _find_files(self,
+                    remote_dir: str,
+                    extensions: List[str],
+                    recursive: bool = True) -> Dict[str, paramiko.SFTPAttributes]:
+        """Обходит каталог через SFTP-канал, без exec_command и запуска find на сервере"""
+        sftp = self._get_sftp()
+        # Та же маска, что у find -iname '*.<ext>': расширение может быть шаблоном, регистр не важен
+        name_regex = re.compile("|".join(translate(f"*.{ext.lstrip('.')}") for ext in extensions),
+                                re.IGNORECASE) if extensions else None
+
+        found_files = {}
+        pending = [remote_dir]
+        while pending:
+            directory = pending.pop()
+            # Удалённые пути всегда POSIX, os.path.join для них не подходит
+            prefix = directory.rstrip("/") + "/"
+            try:
+                # Записи обрабатываются по мере поступления, без списка всего каталога
+                for attr in sftp.listdir_iter(directory):
+                    path = prefix + attr.filename
+                    mode = attr.st_mode or 0
+                    if stat.S_ISDIR(mode):
+                        if recursive:
+                            pending.append(path)
+                    elif stat.S_ISREG(mode) and name_regex is not None and name_regex.match(attr.filename):
+                        found_files[path] = attr
+            except IOError as e:
+                print(f"⚠️ Ошибка при поиске файлов в {directory}: {e}")
 
-        return output
+        return found_files
 
     def download_files(self, 
                    remote_dir: str, 
@@ -144,126 +348,118 @@ class RemoteConnection:
         if not self._connected:
             self.ssh_connect()
 
-        sftp = self._ssh.open_sftp()
         os.makedirs(local_dir, exist_ok=True)
 
         extensions = [pattern.replace("*.", "")] if pattern.startswith("*.") else []
         if pattern == "*":
             extensions = ["*"]  # поддержка wildcard
-        matched_files = self.search_files(remote_dir, extensions)
-
-        matched_files = [f for f in matched_files if self._match_pattern(os.path.basename(f), pattern)]
+        found_files = self._find_files(remote_dir, extensions)
+        compiled = self._compile_pattern(pattern)
+
+        # Файлы из всех подкаталогов складываются в один каталог: при совпадении имён
+        # остаётся последний найденный, иначе параллельные каналы писали бы в один файл
+        targets = {}
+        for remote_path, attr in found_files.items():
+            filename = remote_path.rsplit("/", 1)[-1]
+            if compiled is not None and not compiled.match(filename):
+                continue
+            local_path = os.path.join(local_dir, filename)
+            if local_path in targets:
+                print(f"⚠️ Файл {targets[local_path][0]} заменён файлом {remote_path} с тем же именем")
+            targets[local_path] = (remote_path, attr)
 
+        jobs = []
         total_bytes = 0
-        file_sizes = {}
-
-        for remote_path in matched_files:
-            try:
-                size = sftp.stat(remote_path).st_size
-                total_bytes += size
-                file_sizes[remote_path] = size
-            except IOError:
+        skipped = 0
+        for local_path, (remote_path, attr) in targets.items():
+            # Уже скачанные и не изменившиеся файлы повторно не передаются
+            if self._is_up_to_date(local_path, attr):
+                skipped += 1
                 continue
+            jobs.append((remote_path, local_path, attr))
+            total_bytes += attr.st_size
 
         if total_bytes == 0:
-            print("⚠️ Нет доступных файлов для скачивания.")
+            if skipped:
+                print(f"✅ Все файлы уже скачаны, пропущено: {skipped}")
+            else:
+                print("⚠️ Нет доступных файлов для скачивания.")
             return
 
-        downloaded_bytes = 0
+        if skipped:
+            print(f"⏭️ Пропущено уже скачанных файлов: {skipped}")
 
-        for remote_path in matched_files:
-            filename = os.path.basename(remote_path)
-            local_path = os.path.join(local_dir, filename)
+        on_progress = self._progress_counter(total_bytes, prefix="⬇️ Общая загрузка")
 
+        def download(sftp, remote_path, local_path, attr):
             try:
-                with sftp.open(remote_path, "rb") as remote_file, open(local_path, "wb") as local_file:
-                    chunk_size = 4096
-                    while True:
-                        data = remote_file.read(chunk_size)
-                        if not data:
-                            break
-                        local_file.write(data)
-                        downloaded_bytes += len(data)
-                        self._print_progress_bar(downloaded_bytes, total_bytes, prefix="⬇️ Общая загрузка", bar_width=50)
+                self._download_one(sftp, remote_path, local_path, attr.st_size, on_progress, attr.st_mtime)
             except IOError as e:
                 print(f"\n⚠️ Ошибка при скачивании {remote_path}: {e}")
 
-        print()
-        sftp.close()
-
+        self._run_on_channels(jobs, download)
 
+        print()
 
 
     def load_files(self, remote_dir: str, pattern: str = "*") -> dict:
         if not self._connected:
             self.ssh_connect()
 
-        sftp = self._ssh.open_sftp()
-        file_contents = {}
+        sftp = self._get_sftp()
 
+        compiled = self._compile_pattern(pattern)
+        remote_prefix = remote_dir.rstrip("/") + "/"
+        file_sizes = {}
+        total_bytes = 0
         try:
-            files = sftp.listdir(remote_dir)
+            # Имена и атрибуты приходят вместе и фильтруются по мере поступления, без stat на каждый файл
+            for attr in sftp.listdir_iter(remote_dir):
+                if stat.S_ISREG(attr.st_mode or 0) and (compiled is None or compiled.match(attr.filename)):
+                    file_sizes[attr.filename] = attr.st_size
+                    total_bytes += attr.st_size
         except IOError as e:
             print(f"❌ Ошибка доступа к {remote_dir}: {e}")
             return {}
 
-        matched_files = [f for f in files if self._match_pattern(f, pattern)]
-
-        total_bytes = 0
-        file_sizes = {}
-        for filename in matched_files:
-            try:
-                size = sftp.stat(os.path.join(remote_dir, filename)).st_size
-                total_bytes += size
-                file_sizes[filename] = size
-            except IOError:
-                continue
+        matched_files = list(file_sizes)
 
         if total_bytes == 0:
             print("⚠️ Нет файлов для загрузки.")
             return {}
 
-        read_bytes = 0
+        on_progress = self._progress_counter(total_bytes, prefix="📥 Общая загрузка")
 
-        for filename in matched_files:
-            remote_path = os.path.join(remote_dir, filename)
+        def load(sftp, filename):
+            remote_path = remote_prefix + filename
             try:
-                with sftp.open(remote_path, "rb") as remote_file:
-                    chunk_size = 4096
-                    buffer = bytearray()
-
-                    while True:
-                        data = remote_file.read(chunk_size)
-                        if not data:
-                            break
-                        buffer.extend(data)
-                        read_bytes += len(data)
-                        self._print_progress_bar(read_bytes, total_bytes, prefix="📥 Общая загрузка", bar_width=50)
-
-                    file_contents[filename] = bytes(buffer)
-
+                return self._load_one(sftp, remote_path, file_sizes[filename], on_progress)
             except IOError as e:
                 print(f"\n⚠️ Не удалось загрузить {remote_path}: {e}")
+                return None
+
+        contents = self._run_on_channels([(filename,) for filename in matched_files], load)
+        # Порядок как у списка файлов, независимо от того, какой поток закончил раньше
+        file_contents = {filename: data for filename, data in zip(matched_files, contents) if data is not None}
 
         print()
-        sftp.close()
         return file_contents
 
 
 
 if __name__ == "__main__":
-    ssh = RemoteConnection(hostname="192.168.21.1",
-                           port=22,
-                           username="rnf",
-                           password="12345678")
+    with RemoteConnection(hostname="192.168.21.1",
+                          port=22,
+                          username="rnf",
+                          password="12345678") as ssh:
     
-    files = ssh.search_files(remote_dir="/home/rnf/dev/ros2_iiwa_realsense_camera/images",
-                             extensions=["jpg"])
+        files = ssh.search_files(remote_dir="/home/rnf/dev/ros2_iiwa_realsense_camera/images",
+                                 extensions=["jpg"])
 
-    for f in files:
-        print(f)
+        for f in files:
+            print(f)
 
-    ssh.download_files(remote_dir="/home/rnf/dev/ros2_iiwa_realsense_camera/images",
-                       local_dir="/home/daniel/dev/docker_dev/web_service/calibration_module/images/handeye",
-                       pattern="*")
+        ssh.download_files(remote_dir="/home/rnf/dev/ros2_iiwa_realsense_camera/images",
+                           local_dir="/home/daniel/dev/docker_dev/web_service/calibration_module/images/handeye",
+                           pattern="*")
     
\ No newline at end of file
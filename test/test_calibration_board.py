@@ -11,6 +11,31 @@ from calibration import (
     PDFExporter
 )
 
+# ---------------------------
+# Генерация изображений досок
+# ---------------------------
+
+# Каждая доска генерируется один раз на модуль и переиспользуется тестами
+@pytest.fixture(scope="module", params=[
+    (Checkerboard, dict(squares_x=8, squares_y=6, square_length_mm=20, dpi=72, paper_size="A4")),
+    (CharucoBoard, dict(squares_x=7, squares_y=5, square_length_mm=20, marker_length_mm=15,
+                        dpi=72, paper_size="A4", aruco_dict_name="5x5_250")),
+    (ArucoBoard, dict(squares_x=4, squares_y=4, square_length_mm=30, marker_length_ratio=0.8,
+                      dpi=72, paper_size="A4", aruco_dict_name="5x5_250")),
+    (CircleBoard, dict(squares_x=4, squares_y=3, square_length_mm=20, dpi=72, paper_size="A4")),
+], ids=lambda param: param[0].__name__)
+def board_and_image(request):
+    board_class, kwargs = request.param
+    board = board_class(**kwargs)
+    return board, board.generate()
+
+def test_board_generate(board_and_image):
+    board, image = board_and_image
+    assert isinstance(image, np.ndarray)
+    assert len(image.shape) == 2  # grayscale
+    assert image.dtype == np.uint8
+
+
 # ---------------------------
 # Тесты для базового класса CalibrationBoard
 # ---------------------------
@@ -44,21 +69,6 @@ def test_invalid_paper_size():
 # Тесты для CharucoBoard
 # ---------------------------
 
-def test_charuco_board_generate():
-    charuco = CharucoBoard(
-        squares_x=7,
-        squares_y=5,
-        square_length_mm=20,
-        marker_length_mm=15,
-        dpi=72,
-        paper_size="A4",
-        aruco_dict_name="5x5_250"
-    )
-    image = charuco.generate()
-    assert isinstance(image, np.ndarray)
-    assert len(image.shape) == 2  # grayscale
-    assert image.dtype == np.uint8
-
 def test_invalid_marker_length_mm():
     with pytest.raises(ValueError):
         CharucoBoard(
@@ -87,21 +97,6 @@ def test_invalid_aruco_dict_name():
 # Тесты для ArucoBoard
 # ---------------------------
 
-def test_aruco_board_generate():
-    aruco_board = ArucoBoard(
-        squares_x=4,
-        squares_y=4,
-        square_length_mm=30,
-        marker_length_ratio=0.8,
-        dpi=72,
-        paper_size="A4",
-        aruco_dict_name="5x5_250"
-    )
-    image = aruco_board.generate()
-    assert isinstance(image, np.ndarray)
-    assert len(image.shape) == 2
-    assert image.dtype == np.uint8
-
 def test_invalid_marker_length_ratio():
     with pytest.raises(ValueError):
         ArucoBoard(
@@ -136,35 +131,10 @@ def test_invalid_aruco_dict_in_aruco_board():
         )
 
 
-# ---------------------------
-# Тесты для Checkerboard
-# ---------------------------
-
-def test_checkerboard_generate():
-    board = Checkerboard(squares_x=8, squares_y=6, square_length_mm=20, dpi=72, paper_size="A4")
-    image = board.generate()
-    assert isinstance(image, np.ndarray)
-    assert len(image.shape) == 2
-    assert image.dtype == np.uint8
-
-
 # ---------------------------
 # Тесты для CircleBoard
 # ---------------------------
 
-def test_circle_grid_board_generate():
-    circle_board = CircleBoard(
-        squares_x=4,
-        squares_y=3,
-        square_length_mm=20,
-        dpi=72,
-        paper_size="A4"
-    )
-    image = circle_board.generate()
-    assert isinstance(image, np.ndarray)
-    assert len(image.shape) == 2
-    assert image.dtype == np.uint8
-
 def test_circle_grid_asymmetric():
     circle_board = CircleBoard(
         squares_x=4,
@@ -182,20 +152,20 @@ def test_circle_grid_asymmetric():
 # Тесты для PDFExporter
 # ---------------------------
 
-def test_pdf_exporter():
+# Доска и экспортёр создаются один раз на сессию и общие для тестов экспорта
+@pytest.fixture(scope="session")
+def exporter_and_canvas():
     board = Checkerboard(squares_x=8, squares_y=6, square_length_mm=20, dpi=72, paper_size="A4")
-    canvas = board.generate()
+    return PDFExporter(), board.generate(), board.PAPER_SIZES
 
-    exporter = PDFExporter()
-    pdf_bytes = exporter(canvas=canvas, paper_size="A4", dpi=72, paper_sizes=board.PAPER_SIZES)
+def test_pdf_exporter(exporter_and_canvas):
+    exporter, canvas, paper_sizes = exporter_and_canvas
+    pdf_bytes = exporter(canvas=canvas, paper_size="A4", dpi=72, paper_sizes=paper_sizes)
 
     assert isinstance(pdf_bytes, BytesIO)
     assert pdf_bytes.getbuffer().nbytes > 0
 
-def test_pdf_export_invalid_paper_size():
-    board = Checkerboard(squares_x=8, squares_y=6, square_length_mm=20, dpi=72, paper_size="A4")
-    canvas = board.generate()
-
-    exporter = PDFExporter()
+def test_pdf_export_invalid_paper_size(exporter_and_canvas):
+    exporter, canvas, paper_sizes = exporter_and_canvas
     with pytest.raises(ValueError):
-        exporter(canvas=canvas, paper_size="InvalidSize", dpi=72, paper_sizes=board.PAPER_SIZES)
\ No newline at end of file
+        exporter(canvas=canvas, paper_size="InvalidSize", dpi=72, paper_sizes=paper_sizes)
\ No newline at end of file